@@ -0,0 +1,156 @@
+"""Translation caches shared by the CLI and GUI."""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+
+class LRUCache:
+    """Size-bounded mapping that evicts the least recently used entry."""
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a value and mark it as recently used."""
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            return default
+        return self._data[key]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the oldest entry when full."""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+
+class TranslationCache:
+    """Persistent translation cache backed by SQLite."""
+
+    # Enforce max_entries after this many writes rather than on every one
+    PRUNE_EVERY = 256
+
+    _shared: dict[Path, "TranslationCache"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path: Path, ttl_seconds: int = 0, max_entries: int = 0):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._writes = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # The GUI translates on a worker thread, so share one connection
+        # across threads and serialize access ourselves
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            # A lost write only costs a repeat translation, so skip the
+            # fsync on every commit
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                "hash BLOB PRIMARY KEY, translated TEXT NOT NULL, ts INTEGER NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS translations_ts ON translations (ts)"
+            )
+
+        self.purge_expired()
+
+    @classmethod
+    def shared(
+        cls, path: Path, ttl_seconds: int = 0, max_entries: int = 0
+    ) -> "TranslationCache":
+        """Get the process-wide cache for a path, opening it on first use."""
+        path = Path(path)
+        with cls._shared_lock:
+            cache = cls._shared.get(path)
+            if cache is None:
+                cache = cls._shared[path] = cls(path, ttl_seconds, max_entries)
+            return cache
+
+    @staticmethod
+    def make_key(engine: str, source: str, target: str, text: str) -> bytes:
+        """Build the lookup key for a translation."""
+        payload = f"{engine}\0{source}\0{target}\0{text}".encode()
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
+    def _cutoff(self) -> int:
+        """Get the oldest timestamp that is still fresh."""
+        if self.ttl_seconds <= 0:
+            return 0
+        return int(time.time()) - self.ttl_seconds
+
+    def get(self, key: bytes) -> str | None:
+        """Get a cached translation, or None if missing or expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT translated FROM translations WHERE hash = ? AND ts >= ?",
+                (key, self._cutoff()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: bytes, translated: str) -> None:
+        """Store a translation."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO translations (hash, translated, ts) "
+                "VALUES (?, ?, ?)",
+                (key, translated, int(time.time())),
+            )
+            self._writes += 1
+            prune = self.max_entries > 0 and self._writes % self.PRUNE_EVERY == 0
+        if prune:
+            self.purge_expired()
+
+    def purge_expired(self) -> int:
+        """Delete expired and excess translations and return how many were removed.
+
+        When over ``max_entries``, the oldest translations are dropped first.
+        """
+        with self._lock, self._conn:
+            deleted = 0
+            if self.ttl_seconds > 0:
+                deleted += self._conn.execute(
+                    "DELETE FROM translations WHERE ts < ?", (self._cutoff(),)
+                ).rowcount
+            if self.max_entries > 0:
+                deleted += self._conn.execute(
+                    "DELETE FROM translations WHERE hash IN ("
+                    "SELECT hash FROM translations ORDER BY ts DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                ).rowcount
+        if deleted:
+            logger.info(f"Purged {deleted} cached translations")
+        return deleted
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._shared_lock:
+            if self._shared.get(self.path) is self:
+                del self._shared[self.path]
+        with self._lock:
+            self._conn.close()
@@ -1,13 +1,14 @@
 """Command-line interface for clip_translate."""
 
 import asyncio
+import functools
+import random
 
-import pyperclip as clipboard
 import typer
 from loguru import logger
-from rich.console import Console
-from rich.table import Table
+from rich.console import Console, Group
 
+from clip_translate.clipboard import ClipboardWatcher
 from clip_translate.config import Config
 from clip_translate.core import TranslationEngine, get_supported_languages
 
@@ -15,22 +16,61 @@ app = typer.Typer(name="clip_translate", help="clip_translate CLI")
 console = Console()
 config = Config()
 
+# Static output fragments; the tags are escaped so rich prints the brackets
+_SEPARATOR = "-" * 50
+_CACHED_TAG = "\n[yellow]\\[cached][/yellow]"
+_NEW_TAG = "\n[cyan]\\[new][/cyan]"
+
+# Delay bounds (seconds) between retries after consecutive failed requests
+_MIN_ERROR_BACKOFF = 0.5
+_MAX_ERROR_BACKOFF = 60.0
+
+
+@functools.cache
+def _sorted_languages(engine: str) -> tuple[tuple[str, str], ...]:
+    """Get an engine's supported (code, name) pairs sorted by code."""
+    return tuple(sorted(get_supported_languages(engine).items()))
+
+
+@functools.cache
+def _language_codes(engine: str) -> tuple[frozenset[str], str]:
+    """Get an engine's supported language codes and their printable list."""
+    codes = [code for code, _ in _sorted_languages(engine)]
+    return frozenset(codes), ", ".join(codes)
+
 
 def validate_languages(src_lang: str, target_lang: str, engine: str = "google") -> None:
     """Validate that the source and target languages are supported."""
-    supported = get_supported_languages(engine)
-    if src_lang not in supported.keys() and src_lang != "auto":
+    codes, codes_list = _language_codes(engine)
+    if src_lang not in codes and src_lang != "auto":
         raise typer.BadParameter(
             f"Unsupported source language: {src_lang}. "
-            f"Supported languages are: {', '.join(supported.keys())}"
+            f"Supported languages are: {codes_list}"
         )
-    if target_lang not in supported.keys():
+    if target_lang not in codes:
         raise typer.BadParameter(
             f"Unsupported target language: {target_lang}. "
-            f"Supported languages are: {', '.join(supported.keys())}"
+            f"Supported languages are: {codes_list}"
         )
 
 
+def _retry_after(error: Exception) -> float | None:
+    """Get the server-requested delay from a rate-limit (429) error."""
+    response = getattr(error, "response", None)
+    if response is None or getattr(response, "status_code", None) != 429:
+        return None
+    try:
+        return float(response.headers.get("Retry-After", ""))
+    except ValueError:
+        return None
+
+
+async def _back_off(error: Exception, delay: float) -> float:
+    """Wait after a failed request and return the next backoff delay."""
+    await asyncio.sleep((_retry_after(error) or delay) + random.uniform(0, 0.1))
+    return min(delay * 2, _MAX_ERROR_BACKOFF)
+
+
 async def translate_loop(
     source: str,
     target: str,
@@ -39,6 +79,7 @@ async def translate_loop(
     hiragana: bool = False,
     once: bool = False,
     engine: str = "google",
+    verify_lang: bool = False,
 ) -> None:
     """Main translation loop."""
     # Set engine in config if specified
@@ -47,88 +88,73 @@ async def translate_loop(
         config.save_config()
 
     translation_engine = TranslationEngine(config)
-    previous_text = ""
+    watcher = ClipboardWatcher()
 
     # Setup Japanese converter if needed
     if source == "ja" and (romaji or hiragana):
         translation_engine.setup_japanese_converter(romaji, hiragana)
 
-    while True:
-        text = clipboard.paste()
-        if text != previous_text and text:
-            # First detect the language
-            try:
-                detected_lang = await translation_engine.detect_language(text.strip())
-
-                # Only translate if detected language matches source language
-                if detected_lang != source and source != "auto":
-                    console.print(
-                        f"\n[yellow]Skipped:[/yellow] Detected language '{detected_lang}' doesn't match source '{source}'"
-                    )
-                    previous_text = text
-                    if once:
-                        break
-                    await asyncio.sleep(0.5)
-                    continue
-
-            except Exception as e:
-                console.print(f"[red]Language detection failed:[/red] {e}")
-                if once:
-                    break
-                await asyncio.sleep(0.5)
-                continue
-
-            # Translate text
-            try:
+    # Grows while requests keep failing so a rate-limited API isn't
+    # hammered; clipboard changes made meanwhile collapse to the latest
+    error_backoff = _MIN_ERROR_BACKOFF
+
+    async for text in watcher.changes(once=once):
+        try:
+            if verify_lang and source != "auto":
+                # Detect along with the translation, in one request where
+                # the engine supports it, and drop it on a mismatch
+                (
+                    detected_lang,
+                    translated_text,
+                    original_text,
+                    cached,
+                ) = await translation_engine.detect_and_translate(text, source, target)
+            else:
+                detected_lang = source
                 (
                     translated_text,
                     original_text,
                     cached,
                 ) = await translation_engine.translate_text(text, source, target)
-            except Exception as e:
-                console.print(f"[red]Translation failed:[/red] {e}")
-                if once:
-                    break
-                await asyncio.sleep(0.5)
-                continue
-
-            # Don't copy translation to clipboard in CLI mode - keep original text
-            cache_status = (
-                "[yellow][cached][/yellow]" if cached else "[cyan][new][/cyan]"
-            )
-            console.print(f"\n{cache_status}")
+        except Exception as e:
+            console.print(f"[red]Translation failed:[/red] {e}")
+            if not once:
+                error_backoff = await _back_off(e, error_backoff)
+            continue
 
-            # Show original text if requested
-            if show_original:
-                console.print("[dim]Original:[/dim]")
-                console.print(f"[green]{original_text}[/green]")
+        error_backoff = _MIN_ERROR_BACKOFF
 
-                # Show Japanese reading if requested
-                if source == "ja" and (romaji or hiragana):
-                    reading = translation_engine.get_japanese_reading(
-                        original_text, romaji=romaji, hiragana=hiragana
-                    )
-                    if reading:
-                        reading_label = "Romaji" if romaji else "Hiragana"
-                        console.print(f"[dim]{reading_label}:[/dim]")
-                        for line in reading.split("\n"):
-                            console.print(f"[magenta]{line}[/magenta]")
+        # Only show the translation if the detected language matches
+        if detected_lang != source:
+            console.print(
+                f"\n[yellow]Skipped:[/yellow] Detected language '{detected_lang}' doesn't match source '{source}'"
+            )
+            continue
 
-                console.print("[dim]Translation:[/dim]")
+        # Don't copy translation to clipboard in CLI mode - keep original text.
+        # Collect the whole entry and print it in one write
+        parts = [_CACHED_TAG if cached else _NEW_TAG]
 
-            console.print(f"[bold]{translated_text}[/bold]")
-            console.print("-" * 50)
-            previous_text = text  # Keep tracking original clipboard text
+        # Show original text if requested
+        if show_original:
+            parts += ["[dim]Original:[/dim]", f"[green]{original_text}[/green]"]
 
-            # Exit if only translating once
-            if once:
-                break
+            # Show Japanese reading if requested
+            if source == "ja" and (romaji or hiragana):
+                reading = translation_engine.get_japanese_reading(
+                    original_text, romaji=romaji, hiragana=hiragana
+                )
+                if reading:
+                    reading_label = "Romaji" if romaji else "Hiragana"
+                    parts.append(f"[dim]{reading_label}:[/dim]")
+                    parts += [
+                        f"[magenta]{line}[/magenta]" for line in reading.split("\n")
+                    ]
 
-        await asyncio.sleep(0.5)
+            parts.append("[dim]Translation:[/dim]")
 
-        # Exit if only translating once and nothing to translate
-        if once:
-            break
+        parts += [f"[bold]{translated_text}[/bold]", _SEPARATOR]
+        console.print(Group(*parts))
 
 
 @app.command()
@@ -153,6 +179,11 @@ def translate(
         "-e",
         help="Translation engine (google, openai, deepl, claude)",
     ),
+    verify_lang: bool = typer.Option(
+        False,
+        "--verify-lang",
+        help="Skip clipboard text not detected as the source language",
+    ),
 ) -> None:
     """Translate text from clipboard."""
     try:
@@ -188,7 +219,14 @@ def translate(
 
         asyncio.run(
             translate_loop(
-                source, target, show_original, romaji, hiragana, once, engine
+                source,
+                target,
+                show_original,
+                romaji,
+                hiragana,
+                once,
+                engine,
+                verify_lang,
             )
         )
     except KeyboardInterrupt:
@@ -208,10 +246,10 @@ def languages(
     if engine is None:
         engine = config.get_engine()
 
-    supported = get_supported_languages(engine)
     console.print(f"[bold cyan]Supported language codes for {engine}:[/bold cyan]")
-    for code, name in sorted(supported.items()):
-        console.print(f"  {code:5s} - {name}")
+    console.print(
+        "\n".join(f"  {code:5s} - {name}" for code, name in _sorted_languages(engine))
+    )
     logger.info(f"Listed supported languages for {engine}")
 
 
@@ -225,6 +263,8 @@ def configure(
 ) -> None:
     """Configure translation engines."""
     if engine is None:
+        from rich.table import Table
+
         # Show current configuration
         table = Table(title="Translation Engine Configuration")
         table.add_column("Engine", style="cyan")
@@ -0,0 +1,90 @@
+"""Clipboard change monitoring for the CLI."""
+
+import asyncio
+import sys
+from collections.abc import AsyncIterator, Callable
+
+from loguru import logger
+
+
+def change_counter() -> Callable[[], int] | None:
+    """Get a cheap clipboard change counter for the current platform.
+
+    The counter lets the watcher skip reading the clipboard contents when
+    nothing has changed. Returns None where no such counter is available.
+    """
+    if sys.platform == "win32":
+        import ctypes
+
+        return ctypes.windll.user32.GetClipboardSequenceNumber
+
+    if sys.platform == "darwin":
+        try:
+            from AppKit import NSPasteboard
+        except ImportError:
+            logger.debug("pyobjc not installed, falling back to clipboard polling")
+            return None
+        return NSPasteboard.generalPasteboard().changeCount
+
+    return None
+
+
+class ClipboardWatcher:
+    """Watch the clipboard and yield its text whenever it changes.
+
+    The polling interval backs off while the clipboard is idle and snaps
+    back to the minimum as soon as a change is seen.
+    """
+
+    MIN_INTERVAL = 0.1
+    MAX_INTERVAL = 2.0
+    BACKOFF = 1.5
+
+    def __init__(
+        self, min_interval: float = MIN_INTERVAL, max_interval: float = MAX_INTERVAL
+    ):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._interval = min_interval
+        self._change_count = change_counter()
+
+    def _idle(self) -> float:
+        """Return the current sleep interval and back off for the next tick."""
+        interval = self._interval
+        self._interval = min(self._interval * self.BACKOFF, self.max_interval)
+        return interval
+
+    async def changes(self, once: bool = False) -> AsyncIterator[str]:
+        """Yield new clipboard text as it appears.
+
+        With ``once``, yield the current clipboard text (if any) and stop.
+        """
+        import pyperclip
+
+        # Only the hash of the last text is kept, so a large clipboard
+        # payload is not held in memory between ticks
+        previous_hash = hash("")
+        previous_count = None
+
+        while True:
+            if self._change_count is not None:
+                count = self._change_count()
+                if count == previous_count and not once:
+                    await asyncio.sleep(self._idle())
+                    continue
+                previous_count = count
+
+            # pyperclip shells out on some platforms, so keep it off the loop
+            text = await asyncio.get_running_loop().run_in_executor(
+                None, pyperclip.paste
+            )
+            text_hash = hash(text)
+            if text and text_hash != previous_hash:
+                previous_hash = text_hash
+                self._interval = self.min_interval
+                yield text
+
+            if once:
+                return
+
+            await asyncio.sleep(self._idle())
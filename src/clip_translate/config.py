@@ -1,5 +1,6 @@
 """Configuration management for clip_translate."""
 
+import copy
 import json
 import os
 from pathlib import Path
@@ -7,6 +8,11 @@ from typing import Any
 
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class Config:
     """Configuration manager for translation settings."""
@@ -22,6 +28,11 @@ class Config:
         "default_source": "ja",
         "default_target": "en",
         "cache_enabled": True,
+        "cache_max_entries": 512,
+        "cache_ttl_seconds": 30 * 24 * 60 * 60,  # Persistent cache entries
+        "cache_max_stored": 100_000,
+        # Detect kana, hangul and plain English locally; less accurate
+        "fast_language_detection": False,
         "show_romaji": False,
         "show_hiragana": False,
     }
@@ -37,23 +48,24 @@ class Config:
             self.config_dir = self.config_path.parent
 
         self.config = self.load_config()
+        self._flat = self._flatten(self.config)
 
     def load_config(self) -> dict[str, Any]:
         """Load configuration from file or create default."""
         if self.config_path.exists():
             try:
-                with open(self.config_path) as f:
-                    loaded_config = json.load(f)
+                data = self.config_path.read_bytes()
+                loaded_config = orjson.loads(data) if orjson else json.loads(data)
                 # Merge with defaults to ensure all keys exist
-                config = self.DEFAULT_CONFIG.copy()
+                config = copy.deepcopy(self.DEFAULT_CONFIG)
                 self._deep_update(config, loaded_config)
                 return config
             except Exception as e:
                 logger.error(f"Failed to load config: {e}")
-                return self.DEFAULT_CONFIG.copy()
+                return copy.deepcopy(self.DEFAULT_CONFIG)
         else:
             # Create default config
-            return self.DEFAULT_CONFIG.copy()
+            return copy.deepcopy(self.DEFAULT_CONFIG)
 
     def save_config(self) -> bool:
         """Save configuration to file."""
@@ -62,8 +74,11 @@ class Config:
             self.config_dir.mkdir(parents=True, exist_ok=True)
 
             # Save config
-            with open(self.config_path, "w") as f:
-                json.dump(self.config, f, indent=2)
+            if orjson:
+                data = orjson.dumps(self.config, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self.config, indent=2).encode()
+            self.config_path.write_bytes(data)
 
             logger.info(f"Config saved to {self.config_path}")
             return True
@@ -80,18 +95,21 @@ class Config:
                 base[key] = value
         return base
 
+    @classmethod
+    def _flatten(cls, config: dict[str, Any], prefix: str = "") -> dict[str, Any]:
+        """Map every dotted key path to its value."""
+        flat = {}
+        for key, value in config.items():
+            path = f"{prefix}{key}"
+            flat[path] = value
+            if isinstance(value, dict):
+                flat.update(cls._flatten(value, f"{path}."))
+        return flat
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value."""
-        keys = key.split(".")
-        value = self.config
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-                if value is None:
-                    return default
-            else:
-                return default
-        return value
+        value = self._flat.get(key)
+        return default if value is None else value
 
     def set(self, key: str, value: Any) -> None:
         """Set configuration value."""
@@ -102,6 +120,7 @@ class Config:
                 config[k] = {}
             config = config[k]
         config[keys[-1]] = value
+        self._flat = self._flatten(self.config)
 
     def get_engine_config(self, engine: str) -> dict[str, Any]:
         """Get configuration for specific engine."""
@@ -110,6 +129,7 @@ class Config:
     def set_engine(self, engine: str) -> None:
         """Set the active translation engine."""
         self.config["engine"] = engine
+        self._flat["engine"] = engine
 
     def get_engine(self) -> str:
         """Get the active translation engine."""
@@ -120,6 +140,7 @@ class Config:
         if engine not in self.config:
             self.config[engine] = {}
         self.config[engine]["api_key"] = api_key
+        self._flat = self._flatten(self.config)
 
     def get_api_key(self, engine: str) -> str | None:
         """Get API key for specific engine."""
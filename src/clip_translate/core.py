@@ -1,9 +1,93 @@
 """Core translation logic shared between CLI and GUI."""
 
+import asyncio
+import functools
+import hashlib
+import operator
+import re
+from collections.abc import AsyncIterator, Callable, Mapping
+
 from loguru import logger
 
+from .cache import LRUCache, TranslationCache
 from .config import Config
-from .engines import get_backend
+from .engines import TranslationBackend, get_backend, get_backend_class
+
+# CJK punctuation, kana, kanji and full-width forms
+_JAPANESE_CHARS = re.compile(r"[\u3000-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uff00-\uffef]")
+
+# Texts this long are not memoized whole by get_japanese_reading
+_MAX_MEMO_READING = 4096
+
+# Fields kept from each kakasi token
+_TOKEN_FIELDS = operator.itemgetter("orig", "hira", "hepburn")
+
+# A line break followed by one or more whitespace-only lines
+_BLANK_LINES = re.compile(r"\n\s*\n+")
+
+# Scripts and words that identify a language without asking the engine
+_KANA = re.compile(r"[\u3040-\u30ff]")
+_HANGUL = re.compile(r"[\u1100-\u11ff\uac00-\ud7af]")
+_ENGLISH_WORDS = re.compile(r"\b(?:the|and|of|that|with|this|you|are)\b", re.IGNORECASE)
+
+
+@functools.cache
+def _kakasi_converter() -> Callable[[str], list[dict[str, str]]]:
+    """Load the kakasi dictionaries once and share the converter."""
+    import pykakasi
+
+    return pykakasi.kakasi().convert
+
+
+@functools.lru_cache(maxsize=4096)
+def _convert_tokens(
+    converter: Callable[[str], list[dict[str, str]]], line: str
+) -> tuple[tuple[str, str, str], ...]:
+    """Convert a line with kakasi into (orig, hira, hepburn) tuples.
+
+    Cached per line, so repeated sentences and switching between romaji
+    and hiragana skip the conversion.
+    """
+    return tuple(map(_TOKEN_FIELDS, converter(line)))
+
+
+def _remove_blank_lines(text: str) -> str:
+    """Strip the text and drop empty or whitespace-only lines."""
+    text = text.strip()
+    # Most clips are a single line with nothing to remove
+    if "\n" not in text:
+        return text
+    return _BLANK_LINES.sub("\n", text)
+
+
+def _guess_language(text: str) -> str | None:
+    """Guess the language from its script, or None when it is not obvious.
+
+    Kana only appears in Japanese and hangul only in Korean. ASCII text
+    containing common English words is taken to be English.
+    """
+    if _KANA.search(text):
+        return "ja"
+    if _HANGUL.search(text):
+        return "ko"
+    if text.isascii() and _ENGLISH_WORDS.search(text):
+        return "en"
+    return None
+
+
+def _cache_key(text: str, source: str, target: str) -> bytes:
+    """Build the in-memory cache key for a translation request.
+
+    The key is a fixed-size digest, so long texts are hashed once per
+    request rather than on every dict probe.
+    """
+    payload = f"{source}\0{target}\0{text.strip()}".encode()
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def _detection_key(text: str) -> bytes:
+    """Build the in-memory cache key for a language detection."""
+    return hashlib.blake2b(text.strip().encode(), digest_size=16).digest()
 
 
 class TranslationEngine:
@@ -11,28 +95,70 @@ class TranslationEngine:
 
     def __init__(self, config: Config | None = None):
         self.config = config or Config()
-        self.cache: dict[str, tuple[str, str]] = {}
-        self.converter = None
-        self._backend = None
-        self._init_backend()
+        self.cache = LRUCache(self.config.get("cache_max_entries", 512))
+        # Recopying a text skips detection as well as translation
+        self.detections = LRUCache(128)
+        self.store = self._open_store()
+        self.converter: Callable[[str], list[dict[str, str]]] | None = None
+        # Memoize whole-text readings; lines are cached by _convert_tokens
+        self._reading = functools.lru_cache(maxsize=128)(self._build_reading)
+        # The backend imports its client library and may open connections,
+        # so it is created on first use rather than at startup
+        self._backend: TranslationBackend | None = None
+        self._engine_name: str | None = None
+
+    def _open_store(self) -> TranslationCache | None:
+        """Open the persistent translation cache if caching is enabled."""
+        if not self.config.get("cache_enabled", True):
+            return None
+
+        try:
+            # Engines share one connection per database so the CLI, GUI
+            # and settings dialog don't each open their own
+            return TranslationCache.shared(
+                self.config.config_dir / "cache.db",
+                ttl_seconds=self.config.get("cache_ttl_seconds", 0),
+                max_entries=self.config.get("cache_max_stored", 0),
+            )
+        except Exception as e:
+            logger.warning(f"Persistent translation cache unavailable: {e}")
+            return None
 
-    def _init_backend(self):
-        """Initialize the translation backend."""
+    @property
+    def backend(self) -> TranslationBackend:
+        """Get the translation backend, creating it on first use."""
+        if self._backend is None:
+            return self._init_backend()[0]
+        return self._backend
+
+    @property
+    def engine_name(self) -> str:
+        """Get the name of the engine actually in use, after any fallback."""
+        if self._backend is None or self._engine_name is None:
+            return self._init_backend()[1]
+        return self._engine_name
+
+    def _init_backend(self) -> tuple[TranslationBackend, str]:
+        """Initialize the translation backend and return it with its engine."""
         engine = self.config.get_engine()
         engine_config = self.config.get_engine_config(engine)
 
         try:
-            self._backend = get_backend(engine, **engine_config)
+            backend = get_backend(engine, **engine_config)
             logger.info(f"Initialized {engine} translation backend")
         except Exception as e:
             logger.error(f"Failed to initialize {engine} backend: {e}")
             # Fallback to Google Translate
             if engine != "google":
                 logger.info("Falling back to Google Translate")
-                self._backend = get_backend("google")
+                backend = get_backend("google")
+                engine = "google"
             else:
                 raise
 
+        self._backend, self._engine_name = backend, engine
+        return backend, engine
+
     def switch_engine(self, engine: str) -> bool:
         """Switch to a different translation engine."""
         try:
@@ -45,11 +171,13 @@ class TranslationEngine:
                 return False
 
             self._backend = new_backend
+            self._engine_name = engine
             self.config.set_engine(engine)
             self.config.save_config()
 
             # Clear cache when switching engines
             self.cache.clear()
+            self.detections.clear()
 
             logger.info(f"Switched to {engine} translation engine")
             return True
@@ -58,18 +186,31 @@ class TranslationEngine:
             logger.error(f"Failed to switch to {engine}: {e}")
             return False
 
+    def reload_backend(self) -> None:
+        """Use the configured engine from the next request on.
+
+        The backend is recreated lazily, so its clients are built on the
+        event loop that uses them. Caches and the Japanese converter are
+        kept, except the in-memory caches, whose keys don't include the
+        engine.
+        """
+        self._backend = None
+        self._engine_name = None
+        self.cache.clear()
+        self.detections.clear()
+
     def validate_languages(self, src_lang: str, target_lang: str) -> None:
         """Validate that the source and target languages are supported."""
-        supported = self._backend.get_supported_languages()
-        if src_lang not in supported and src_lang != "auto":
+        codes = self.backend.language_codes
+        if src_lang not in codes and src_lang != "auto":
             raise ValueError(
                 f"Unsupported source language: {src_lang}. "
-                f"Supported languages are: {', '.join(supported.keys())}"
+                f"Supported languages are: {self.backend.language_list}"
             )
-        if target_lang not in supported:
+        if target_lang not in codes:
             raise ValueError(
                 f"Unsupported target language: {target_lang}. "
-                f"Supported languages are: {', '.join(supported.keys())}"
+                f"Supported languages are: {self.backend.language_list}"
             )
 
     def setup_japanese_converter(
@@ -77,18 +218,91 @@ class TranslationEngine:
     ) -> bool:
         """Setup Japanese text converter for readings."""
         try:
-            import pykakasi
-
-            kks = pykakasi.kakasi()
-            self.converter = kks.convert
+            self.converter = _kakasi_converter()
+            self._reading.cache_clear()
             return True
         except ImportError:
             logger.warning("pykakasi not installed for Japanese readings")
             return False
 
     async def detect_language(self, text: str) -> str | None:
-        """Detect the language of the given text."""
-        return await self._backend.detect_language(text)
+        """Detect the language of the given text.
+
+        With ``fast_language_detection`` enabled, obvious cases are decided
+        locally from the script instead of by a backend request.
+        """
+        if self.config.get("fast_language_detection"):
+            detected = _guess_language(text)
+            if detected is not None:
+                return detected
+
+        detected = self._lookup_detection(text)
+        if detected is None:
+            detected = await self.backend.detect_language(text)
+            if detected is not None:
+                self._remember_detection(text, detected)
+        return detected
+
+    def _lookup_detection(self, text: str) -> str | None:
+        """Look up a detected language in memory, then on disk."""
+        key = _detection_key(text)
+        detected: str | None = self.detections.get(key)
+        if detected is None and self.store is not None:
+            # Detections share the store with translations under a
+            # pseudo language pair that no real request uses
+            detected = self.store.get(
+                self.store.make_key(self.engine_name, "detect", "", text.strip())
+            )
+            if detected is not None:
+                self.detections.set(key, detected)
+        return detected
+
+    def _remember_detection(self, text: str, detected: str) -> None:
+        """Cache a detected language in memory and on disk."""
+        self.detections.set(_detection_key(text), detected)
+        if self.store is not None:
+            self.store.set(
+                self.store.make_key(self.engine_name, "detect", "", text.strip()),
+                detected,
+            )
+
+    def _lookup(
+        self, text: str, original_text: str, source: str, target: str
+    ) -> str | None:
+        """Look up a cached translation in memory, then on disk."""
+        key = _cache_key(text, source, target)
+        cached: tuple[str, str] | None = self.cache.get(key)
+        # Compare the text as well, in case of a digest collision
+        if cached is not None and cached[1] == original_text:
+            return cached[0]
+
+        if self.store is not None:
+            translated_text = self.store.get(
+                self.store.make_key(self.engine_name, source, target, original_text)
+            )
+            if translated_text is not None:
+                self.cache.set(key, (translated_text, original_text))
+                return translated_text
+
+        return None
+
+    def _remember(
+        self,
+        text: str,
+        original_text: str,
+        translated_text: str,
+        source: str,
+        target: str,
+    ) -> None:
+        """Cache a translation in memory and on disk."""
+        self.cache.set(
+            _cache_key(text, source, target), (translated_text, original_text)
+        )
+        if self.store is not None:
+            self.store.set(
+                self.store.make_key(self.engine_name, source, target, original_text),
+                translated_text,
+            )
 
     async def translate_text(
         self, text: str, source: str, target: str, use_cache: bool = True
@@ -100,29 +314,30 @@ class TranslationEngine:
             Tuple of (translated_text, original_text, was_cached)
         """
         # Clean the input text
-        original_lines = [line for line in text.strip().split("\n") if line.strip()]
-        original_text = "\n".join(original_lines)
+        original_text = _remove_blank_lines(text)
+
+        # Nothing to translate; skip the backend and keep it out of the cache
+        if not original_text or source == target:
+            return original_text, original_text, False
 
         # Check cache
-        if use_cache and text in self.cache:
-            translated_text, _ = self.cache[text]
-            return translated_text, original_text, True
+        if use_cache:
+            translated_text = self._lookup(text, original_text, source, target)
+            if translated_text is not None:
+                return translated_text, original_text, True
 
         # Perform translation
         try:
-            translated_text = await self._backend.translate(
+            translated_text = await self.backend.translate(
                 original_text, source=source, target=target
             )
 
             # Clean translated text
-            translated_lines = [
-                line for line in translated_text.strip().split("\n") if line.strip()
-            ]
-            translated_text = "\n".join(translated_lines)
+            translated_text = _remove_blank_lines(translated_text)
 
             # Cache the result
             if use_cache:
-                self.cache[text] = (translated_text, original_text)
+                self._remember(text, original_text, translated_text, source, target)
 
             return translated_text, original_text, False
 
@@ -130,6 +345,221 @@ class TranslationEngine:
             logger.error(f"Translation failed: {e}")
             raise
 
+    async def translate_text_stream(
+        self, text: str, source: str, target: str, use_cache: bool = True
+    ) -> AsyncIterator[tuple[str, str, bool]]:
+        """
+        Translate text, yielding the translation so far as it streams in.
+
+        Engines without streaming, and cached translations, yield once.
+
+        Yields:
+            Tuples of (translated_text, original_text, was_cached), the last
+            holding the complete translation
+        """
+        original_text = _remove_blank_lines(text)
+
+        if not original_text or source == target:
+            yield original_text, original_text, False
+            return
+
+        if use_cache:
+            translated_text = self._lookup(text, original_text, source, target)
+            if translated_text is not None:
+                yield translated_text, original_text, True
+                return
+
+        translated_text = ""
+        try:
+            async for piece in self.backend.translate_stream(
+                original_text, source=source, target=target
+            ):
+                translated_text += piece
+                yield _remove_blank_lines(translated_text), original_text, False
+        except Exception as e:
+            logger.error(f"Translation failed: {e}")
+            raise
+
+        translated_text = _remove_blank_lines(translated_text)
+        if use_cache and translated_text:
+            self._remember(text, original_text, translated_text, source, target)
+
+    async def detect_and_translate(
+        self, text: str, source: str, target: str, use_cache: bool = True
+    ) -> tuple[str | None, str, str, bool]:
+        """
+        Detect the language of the text and translate it.
+
+        Uses a single backend request where the engine supports it. Cached
+        translations still need a detection request.
+
+        Returns:
+            Tuple of (detected_lang, translated_text, original_text, was_cached)
+        """
+        original_text = _remove_blank_lines(text)
+        if not original_text:
+            return None, original_text, original_text, False
+
+        translated_text = None
+        if source == target:
+            translated_text = original_text
+        elif use_cache:
+            translated_text = self._lookup(text, original_text, source, target)
+        if translated_text is not None:
+            detected = await self.detect_language(original_text)
+            return detected, translated_text, original_text, source != target
+
+        detected = None
+        if self.config.get("fast_language_detection"):
+            detected = _guess_language(original_text)
+        try:
+            if detected is None:
+                detected, translated_text = await self.backend.detect_and_translate(
+                    original_text, source=source, target=target
+                )
+            else:
+                translated_text = await self.backend.translate(
+                    original_text, source=source, target=target
+                )
+        except Exception as e:
+            logger.error(f"Translation failed: {e}")
+            raise
+
+        translated_text = _remove_blank_lines(translated_text)
+        if use_cache:
+            self._remember(text, original_text, translated_text, source, target)
+            if detected is not None:
+                self._remember_detection(original_text, detected)
+
+        return detected, translated_text, original_text, False
+
+    async def translate_many(
+        self,
+        texts: list[str],
+        source: str,
+        target: str,
+        bulk: bool = False,
+        max_concurrency: int = 8,
+    ) -> list[tuple[str, str, bool]]:
+        """
+        Translate many independent texts concurrently.
+
+        At most ``max_concurrency`` requests are in flight at once, and
+        duplicate texts are translated once. With ``bulk``, the texts are
+        sent as an asynchronous bulk job instead (OpenAI's Batch API), which
+        is cheaper but can take hours; engines without one use a regular
+        batch.
+
+        Returns:
+            List of (translated_text, original_text, was_cached) tuples
+        """
+        if bulk:
+            return await self.translate_batch(texts, source, target, bulk=True)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def translate_one(text: str) -> tuple[str, str, bool]:
+            async with semaphore:
+                return await self.translate_text(text, source, target)
+
+        unique = list(dict.fromkeys(texts))
+        results = dict(
+            zip(unique, await asyncio.gather(*map(translate_one, unique)), strict=True)
+        )
+        return [results[text] for text in texts]
+
+    async def translate_batch(
+        self,
+        texts: list[str],
+        source: str,
+        target: str,
+        use_cache: bool = True,
+        bulk: bool = False,
+    ) -> list[tuple[str, str, bool]]:
+        """
+        Translate several texts with a single backend batch call.
+
+        Cached texts are served from the cache and duplicates are only sent
+        once. With ``bulk``, the engine's bulk API is used if it has one.
+
+        Returns:
+            List of (translated_text, original_text, was_cached) tuples
+        """
+        results: dict[int, tuple[str, str, bool]] = {}
+        pending: dict[str, list[int]] = {}
+
+        for i, text in enumerate(texts):
+            original_text = _remove_blank_lines(text)
+            if not original_text or source == target:
+                results[i] = (original_text, original_text, False)
+                continue
+            if use_cache:
+                translated_text = self._lookup(text, original_text, source, target)
+                if translated_text is not None:
+                    results[i] = (translated_text, original_text, True)
+                    continue
+            pending.setdefault(original_text, []).append(i)
+
+        if pending:
+            originals = list(pending)
+            # Only some engines offer a bulk API; the rest batch as usual
+            request = self.backend.translate_batch
+            if bulk:
+                request = getattr(self.backend, "translate_bulk", request)
+            try:
+                translations = await request(originals, source=source, target=target)
+            except Exception as e:
+                logger.error(f"Batch translation failed: {e}")
+                raise
+
+            for original_text, translated_text in zip(
+                originals, translations, strict=True
+            ):
+                translated_text = _remove_blank_lines(translated_text)
+                indices = pending[original_text]
+                for i in indices:
+                    results[i] = (translated_text, original_text, False)
+                if use_cache:
+                    self._remember(
+                        texts[indices[0]],
+                        original_text,
+                        translated_text,
+                        source,
+                        target,
+                    )
+
+        return [results[i] for i in range(len(texts))]
+
+    def _convert_line(self, line: str, romaji: bool) -> str | None:
+        """Get the reading for a single non-empty line."""
+        # kakasi returns lines without Japanese characters unchanged,
+        # so skip the conversion for them
+        if not _JAPANESE_CHARS.search(line):
+            return line if romaji else None
+
+        tokens = _convert_tokens(self.converter, line)
+        if not tokens:
+            return None
+
+        origs, hiras, hepburns = zip(*tokens, strict=True)
+        if romaji:
+            return " ".join(hepburns)
+        return "".join(hiras) if hiras != origs else None
+
+    def _build_reading(self, text: str, romaji: bool) -> str | None:
+        """Get the reading for each non-empty line of the text."""
+        reading_lines = []
+
+        for line in text.split("\n"):
+            if not line.strip():
+                continue
+
+            reading = self._convert_line(line, romaji)
+            if reading is not None:
+                reading_lines.append(reading)
+
+        return "\n".join(reading_lines) if reading_lines else None
+
     def get_japanese_reading(
         self, text: str, romaji: bool = False, hiragana: bool = False
     ) -> str | None:
@@ -137,50 +567,122 @@ class TranslationEngine:
         if not self.converter:
             return None
 
-        lines = text.split("\n")
-        reading_lines = []
+        # Keep very long texts out of the memo; their lines are still cached
+        if len(text) >= _MAX_MEMO_READING:
+            return self._build_reading(text, romaji)
+        return self._reading(text, romaji)
 
-        for line in lines:
-            if line.strip():
-                result = self.converter(line)
-
-                if romaji:
-                    # Convert to romaji
-                    romaji_parts = []
-                    for item in result:
-                        if item["orig"] != item["hepburn"]:
-                            romaji_parts.append(item["hepburn"])
-                        else:
-                            romaji_parts.append(item["orig"])
-                    reading_line = " ".join(romaji_parts)
-                else:  # hiragana
-                    # Convert to hiragana
-                    hiragana_parts = []
-                    has_japanese = False
-                    for item in result:
-                        if item["orig"] != item["hira"]:
-                            has_japanese = True
-                            hiragana_parts.append(item["hira"])
-                        else:
-                            hiragana_parts.append(item["orig"])
-
-                    if not has_japanese:
-                        continue
-                    reading_line = "".join(hiragana_parts)
-
-                reading_lines.append(reading_line)
 
-        return "\n".join(reading_lines) if reading_lines else None
+# A queued request: text, source, target and the caller's result future
+_BatchRequest = tuple[str, str, str, asyncio.Future[tuple[str, str, bool]]]
+
+
+class BatchingTranslator:
+    """Coalesce concurrent translation requests into batched backend calls.
 
+    Requests arriving within ``window`` seconds of each other (up to
+    ``max_batch`` of them) are sent to the engine as one batch per
+    language pair.
+    """
 
-def get_supported_languages(engine: str | None = None) -> dict[str, str]:
+    def __init__(
+        self, engine: TranslationEngine, window: float = 0.05, max_batch: int = 8
+    ):
+        self.engine = engine
+        self.window = window
+        self.max_batch = max_batch
+        self._queue: asyncio.Queue[_BatchRequest] = asyncio.Queue()
+        self._worker: asyncio.Task[None] | None = None
+
+    async def translate(
+        self, text: str, source: str, target: str
+    ) -> tuple[str, str, bool]:
+        """Queue text for translation and wait for its batch to complete."""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._drain())
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[tuple[str, str, bool]] = loop.create_future()
+        await self._queue.put((text, source, target, future))
+        return await future
+
+    async def close(self) -> None:
+        """Stop the background batching task and fail requests still queued."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        queued = []
+        while not self._queue.empty():
+            queued.append(self._queue.get_nowait())
+        self._fail(queued)
+
+    async def _drain(self) -> None:
+        """Collect queued requests into batches and flush them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                deadline = loop.time() + self.window
+                while len(batch) < self.max_batch:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except TimeoutError:
+                        break
+                await self._flush(batch)
+            finally:
+                # Callers must not wait forever on a batch cut short by close()
+                self._fail(batch)
+
+    async def _flush(self, batch: list[_BatchRequest]) -> None:
+        """Translate a batch, one engine call per language pair."""
+        groups: dict[tuple[str, str], list[_BatchRequest]] = {}
+        for item in batch:
+            groups.setdefault((item[1], item[2]), []).append(item)
+
+        for (source, target), items in groups.items():
+            try:
+                results = await self.engine.translate_batch(
+                    [text for text, *_ in items], source, target
+                )
+            except Exception as e:
+                for *_, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (*_, future), result in zip(items, results, strict=True):
+                if not future.done():
+                    future.set_result(result)
+
+    @staticmethod
+    def _fail(requests: list[_BatchRequest]) -> None:
+        """Fail the requests that have not been answered yet."""
+        for *_, future in requests:
+            if not future.done():
+                future.set_exception(RuntimeError("Batching translator closed"))
+
+
+def get_supported_languages(engine: str | None = None) -> Mapping[str, str]:
     """Get dictionary of supported language codes and names."""
     if engine:
-        # Get languages for specific engine
+        # Read the engine's static language table without constructing the
+        # backend, which would import its client library
         try:
-            backend = get_backend(engine)
-            return backend.get_supported_languages()
-        except:
+            languages: Mapping[str, str] | None = getattr(
+                get_backend_class(engine), "LANGUAGES", None
+            )
+            if languages is not None:
+                return languages
+        except ValueError:
             pass
 
     # Default to Google Translate languages for compatibility
@@ -1,11 +1,149 @@
 """Translation engine implementations."""
 
 import asyncio
+import atexit
+import functools
+import json
 import os
+import re
+import weakref
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Any
 
 from loguru import logger
 
+# LLM batches wrap each text in numbered tags so multi-line texts survive
+_SEGMENT = re.compile(r"<t(\d+)>(.*?)</t\1>", re.DOTALL)
+
+
+# API clients keyed per event loop, since their connection pools bind to
+# the loop they first run on
+_loop_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[str, ...], Any]
+] = weakref.WeakKeyDictionary()
+
+
+def _shared_client(key: tuple[str, ...], factory: Callable[[], Any]) -> Any:
+    """Get a client shared by all backends on the running event loop.
+
+    Backends recreated by a fallback or engine switch then reuse warm
+    connections. Outside an event loop a new client is returned.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return factory()
+
+    clients = _loop_clients.setdefault(loop, {})
+    if key not in clients:
+        clients[key] = factory()
+    return clients[key]
+
+
+async def close_shared_clients() -> None:
+    """Close the clients shared on the running event loop and their pools."""
+    clients = _loop_clients.pop(asyncio.get_running_loop(), {})
+    for key, client in clients.items():
+        try:
+            await client.__aexit__(None, None, None)
+        except Exception as e:
+            logger.debug(f"Failed to close {key[0]} client: {e}")
+
+
+# The deepl library is synchronous; give it its own threads so its calls
+# don't compete with other work on the default executor
+_DEEPL_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="deepl")
+atexit.register(_DEEPL_POOL.shutdown, wait=False)
+
+
+@functools.cache
+def _deepl_translator(api_key: str) -> Any:
+    """Get the DeepL client for an API key, shared across backends."""
+    import deepl
+
+    return deepl.Translator(api_key)
+
+
+@functools.lru_cache(maxsize=256)
+def _translation_prompt(source_name: str, target_name: str) -> str:
+    """Build the system prompt for translating a single text."""
+    return (
+        f"Translate the text inside <t></t> from {source_name} to {target_name}, "
+        f"keeping its formatting and style. Output only the translation, "
+        f"without the tags."
+    )
+
+
+def _wrap(text: str) -> str:
+    """Mark the text to translate so the model doesn't treat it as a request."""
+    return f"<t>{text}</t>"
+
+
+def _unwrap(reply: str) -> str:
+    """Strip the marker tags if the model echoed them back."""
+    reply = reply.strip()
+    if reply.startswith("<t>") and reply.endswith("</t>"):
+        reply = reply[3:-4].strip()
+    return reply
+
+
+@functools.lru_cache(maxsize=256)
+def _batch_prompt(source_name: str, target_name: str) -> str:
+    """Build the system prompt for translating a batch of tagged texts."""
+    return (
+        f"You are a professional translator. Translate each text from "
+        f"{source_name} to {target_name}. Each text is wrapped in numbered tags "
+        f"like <t0>...</t0>; reply with every translation wrapped in the same "
+        f"tags, in order. Maintain the original formatting and style. Only "
+        f"provide the translations, no explanations."
+    )
+
+
+def _join_segments(texts: list[str]) -> str:
+    """Wrap each text in its numbered batch tag."""
+    return "\n".join(f"<t{i}>{text}</t{i}>" for i, text in enumerate(texts))
+
+
+def _split_segments(reply: str, count: int) -> list[str] | None:
+    """Extract the tagged translations, or None if any are missing."""
+    segments = {int(i): text.strip() for i, text in _SEGMENT.findall(reply)}
+    if len(segments) != count or any(i not in segments for i in range(count)):
+        return None
+    return [segments[i] for i in range(count)]
+
+
+@functools.lru_cache(maxsize=256)
+def _detect_translate_prompt(source_name: str | None, target_name: str) -> str:
+    """Build the system prompt for detecting and translating in one reply."""
+    direction = f"from {source_name} to {target_name}" if source_name else target_name
+    return (
+        f"You are a professional translator. Identify the language of the text "
+        f"and translate it {direction}. Maintain the original formatting and "
+        f'style. Respond with only a JSON object with the keys "lang" (the ISO '
+        f'639-1 code of the text\'s language) and "translation".'
+    )
+
+
+def _parse_detect_translate(
+    reply: str, languages: Mapping[str, str]
+) -> tuple[str | None, str] | None:
+    """Parse a detect-and-translate JSON reply, or None if malformed."""
+    # Tolerate prose or code fences around the object
+    start, end = reply.find("{"), reply.rfind("}")
+    try:
+        data = json.loads(reply[start : end + 1])
+        translation = data["translation"]
+    except (ValueError, KeyError, TypeError):
+        return None
+    if not isinstance(translation, str):
+        return None
+
+    lang = str(data.get("lang", "")).strip().lower()
+    return (lang if lang in languages else None), translation.strip()
+
 
 class TranslationBackend(ABC):
     """Abstract base class for translation backends."""
@@ -20,8 +158,49 @@ class TranslationBackend(ABC):
         """Translate text from source to target language."""
         pass
 
+    async def translate_stream(
+        self, text: str, source: str, target: str
+    ) -> AsyncIterator[str]:
+        """Translate text, yielding pieces of the translation as they arrive.
+
+        Backends without streaming yield the whole translation at once.
+        """
+        yield await self.translate(text, source=source, target=target)
+
+    async def translate_batch(
+        self, texts: list[str], source: str, target: str
+    ) -> list[str]:
+        """Translate several texts, concurrently by default.
+
+        Backends whose API accepts a list of texts override this to send a
+        single request.
+        """
+        return list(
+            await asyncio.gather(
+                *(self.translate(text, source=source, target=target) for text in texts)
+            )
+        )
+
+    async def detect_and_translate(
+        self, text: str, source: str, target: str
+    ) -> tuple[str | None, str]:
+        """Detect the language of the text and translate it.
+
+        Runs both requests concurrently by default. Backends that can report
+        the language along with the translation override this to make one
+        request.
+
+        Returns:
+            Tuple of (detected_lang, translated_text)
+        """
+        detected, translated = await asyncio.gather(
+            self.detect_language(text),
+            self.translate(text, source=source, target=target),
+        )
+        return detected, translated
+
     @abstractmethod
-    def get_supported_languages(self) -> dict[str, str]:
+    def get_supported_languages(self) -> Mapping[str, str]:
         """Get dictionary of supported language codes and names."""
         pass
 
@@ -30,6 +209,16 @@ class TranslationBackend(ABC):
         """Validate that the backend is properly configured."""
         pass
 
+    @functools.cached_property
+    def language_codes(self) -> frozenset[str]:
+        """Supported language codes, for fast membership checks."""
+        return frozenset(self.get_supported_languages())
+
+    @functools.cached_property
+    def language_list(self) -> str:
+        """Comma-separated supported language codes for error messages."""
+        return ", ".join(self.get_supported_languages())
+
 
 class GoogleTranslateBackend(TranslationBackend):
     """Google Translate backend using googletrans library."""
@@ -37,8 +226,8 @@ class GoogleTranslateBackend(TranslationBackend):
     def __init__(self):
         from googletrans import LANGUAGES, Translator
 
-        self.translator = Translator()
-        self.languages = LANGUAGES
+        self.translator = _shared_client(("google",), Translator)
+        self.languages = MappingProxyType(LANGUAGES)
 
     async def detect_language(self, text: str) -> str | None:
         """Detect the language of the given text."""
@@ -58,7 +247,36 @@ class GoogleTranslateBackend(TranslationBackend):
             logger.error(f"Translation failed: {e}")
             raise
 
-    def get_supported_languages(self) -> dict[str, str]:
+    async def translate_batch(
+        self, texts: list[str], source: str, target: str
+    ) -> list[str]:
+        """Translate several texts using googletrans list input."""
+        try:
+            results = await self.translator.translate(texts, src=source, dest=target)
+            return [result.text for result in results]
+        except Exception as e:
+            logger.error(f"Batch translation failed: {e}")
+            raise
+
+    async def detect_and_translate(
+        self, text: str, source: str, target: str
+    ) -> tuple[str | None, str]:
+        """Translate with auto-detection and read back the detected language."""
+        # Google only reports the detected language when asked to detect, so
+        # detect while translating and only translate again from the given
+        # source when the text turns out to be in another language
+        try:
+            result = await self.translator.translate(text, src="auto", dest=target)
+            translated = result.text
+            if source != "auto" and result.src.lower() != source:
+                retry = await self.translator.translate(text, src=source, dest=target)
+                translated = retry.text
+            return result.src, translated
+        except Exception as e:
+            logger.error(f"Translation failed: {e}")
+            raise
+
+    def get_supported_languages(self) -> Mapping[str, str]:
         """Get dictionary of supported language codes and names."""
         return self.languages
 
@@ -70,71 +288,74 @@ class GoogleTranslateBackend(TranslationBackend):
 class OpenAIBackend(TranslationBackend):
     """OpenAI GPT-based translation backend."""
 
-    # Language mapping for OpenAI (common languages)
-    LANGUAGES = {
-        "en": "English",
-        "es": "Spanish",
-        "fr": "French",
-        "de": "German",
-        "it": "Italian",
-        "pt": "Portuguese",
-        "ru": "Russian",
-        "ja": "Japanese",
-        "ko": "Korean",
-        "zh-cn": "Chinese (Simplified)",
-        "zh-tw": "Chinese (Traditional)",
-        "ar": "Arabic",
-        "hi": "Hindi",
-        "nl": "Dutch",
-        "pl": "Polish",
-        "tr": "Turkish",
-        "sv": "Swedish",
-        "da": "Danish",
-        "no": "Norwegian",
-        "fi": "Finnish",
-        "el": "Greek",
-        "he": "Hebrew",
-        "th": "Thai",
-        "vi": "Vietnamese",
-        "id": "Indonesian",
-        "ms": "Malay",
-        "cs": "Czech",
-        "hu": "Hungarian",
-        "ro": "Romanian",
-        "uk": "Ukrainian",
-        "bg": "Bulgarian",
-        "hr": "Croatian",
-        "sr": "Serbian",
-        "sk": "Slovak",
-        "sl": "Slovenian",
-        "lt": "Lithuanian",
-        "lv": "Latvian",
-        "et": "Estonian",
-        "fa": "Persian",
-        "ur": "Urdu",
-        "bn": "Bengali",
-        "ta": "Tamil",
-        "te": "Telugu",
-        "mr": "Marathi",
-        "gu": "Gujarati",
-        "sw": "Swahili",
-        "af": "Afrikaans",
-        "ca": "Catalan",
-        "eu": "Basque",
-        "ga": "Irish",
-        "cy": "Welsh",
-        "is": "Icelandic",
-        "mk": "Macedonian",
-        "sq": "Albanian",
-        "mt": "Maltese",
-        "tl": "Filipino",
-        "auto": "Auto-detect",
-    }
+    # Language mapping for OpenAI (common languages), read-only so it can
+    # be handed out without copying
+    LANGUAGES = MappingProxyType(
+        {
+            "en": "English",
+            "es": "Spanish",
+            "fr": "French",
+            "de": "German",
+            "it": "Italian",
+            "pt": "Portuguese",
+            "ru": "Russian",
+            "ja": "Japanese",
+            "ko": "Korean",
+            "zh-cn": "Chinese (Simplified)",
+            "zh-tw": "Chinese (Traditional)",
+            "ar": "Arabic",
+            "hi": "Hindi",
+            "nl": "Dutch",
+            "pl": "Polish",
+            "tr": "Turkish",
+            "sv": "Swedish",
+            "da": "Danish",
+            "no": "Norwegian",
+            "fi": "Finnish",
+            "el": "Greek",
+            "he": "Hebrew",
+            "th": "Thai",
+            "vi": "Vietnamese",
+            "id": "Indonesian",
+            "ms": "Malay",
+            "cs": "Czech",
+            "hu": "Hungarian",
+            "ro": "Romanian",
+            "uk": "Ukrainian",
+            "bg": "Bulgarian",
+            "hr": "Croatian",
+            "sr": "Serbian",
+            "sk": "Slovak",
+            "sl": "Slovenian",
+            "lt": "Lithuanian",
+            "lv": "Latvian",
+            "et": "Estonian",
+            "fa": "Persian",
+            "ur": "Urdu",
+            "bn": "Bengali",
+            "ta": "Tamil",
+            "te": "Telugu",
+            "mr": "Marathi",
+            "gu": "Gujarati",
+            "sw": "Swahili",
+            "af": "Afrikaans",
+            "ca": "Catalan",
+            "eu": "Basque",
+            "ga": "Irish",
+            "cy": "Welsh",
+            "is": "Icelandic",
+            "mk": "Macedonian",
+            "sq": "Albanian",
+            "mt": "Maltese",
+            "tl": "Filipino",
+            "auto": "Auto-detect",
+        }
+    )
 
     def __init__(self, api_key: str | None = None, model: str = "gpt-4o-mini"):
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         self.model = model
-        self.client = None
+        self.client: Any = None
         self._init_client()
 
     def _init_client(self):
@@ -143,7 +364,10 @@ class OpenAIBackend(TranslationBackend):
             try:
                 from openai import AsyncOpenAI
 
-                self.client = AsyncOpenAI(api_key=self.api_key)
+                self.client = _shared_client(
+                    ("openai", self.api_key),
+                    lambda: AsyncOpenAI(api_key=self.api_key),
+                )
             except ImportError:
                 logger.error("OpenAI library not installed. Run: pip install openai")
                 self.client = None
@@ -181,6 +405,8 @@ class OpenAIBackend(TranslationBackend):
         """Translate text from source to target language."""
         if not self.client:
             raise ValueError("OpenAI client not initialized. Check API key.")
+        if not text.strip():
+            return ""
 
         source_name = self.LANGUAGES.get(source, source)
         target_name = self.LANGUAGES.get(target, target)
@@ -191,21 +417,203 @@ class OpenAIBackend(TranslationBackend):
                 messages=[
                     {
                         "role": "system",
-                        "content": f"You are a professional translator. Translate text from {source_name} to {target_name}. Maintain the original formatting and style. Only provide the translation, no explanations.",
+                        "content": _translation_prompt(source_name, target_name),
                     },
-                    {"role": "user", "content": text},
+                    {"role": "user", "content": _wrap(text)},
                 ],
                 temperature=0.3,
                 max_tokens=4096,
             )
 
-            return response.choices[0].message.content.strip()
+            return _unwrap(response.choices[0].message.content)
+
+        except Exception as e:
+            logger.error(f"Translation failed: {e}")
+            raise
+
+    async def translate_stream(
+        self, text: str, source: str, target: str
+    ) -> AsyncIterator[str]:
+        """Translate text, yielding pieces of the translation as they arrive."""
+        if not self.client:
+            raise ValueError("OpenAI client not initialized. Check API key.")
+        if not text.strip():
+            return
+
+        source_name = self.LANGUAGES.get(source, source)
+        target_name = self.LANGUAGES.get(target, target)
+
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": _translation_prompt(source_name, target_name),
+                    },
+                    {"role": "user", "content": _wrap(text)},
+                ],
+                temperature=0.3,
+                max_tokens=4096,
+                stream=True,
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
 
         except Exception as e:
             logger.error(f"Translation failed: {e}")
             raise
 
-    def get_supported_languages(self) -> dict[str, str]:
+    async def translate_batch(
+        self, texts: list[str], source: str, target: str
+    ) -> list[str]:
+        """Translate several texts in a single chat completion."""
+        if len(texts) < 2:
+            return await super().translate_batch(texts, source=source, target=target)
+        if not self.client:
+            raise ValueError("OpenAI client not initialized. Check API key.")
+
+        source_name = self.LANGUAGES.get(source, source)
+        target_name = self.LANGUAGES.get(target, target)
+
+        try:
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": _batch_prompt(source_name, target_name),
+                    },
+                    {"role": "user", "content": _join_segments(texts)},
+                ],
+                temperature=0.3,
+                max_tokens=4096,
+            )
+        except Exception as e:
+            logger.error(f"Batch translation failed: {e}")
+            raise
+
+        translations = _split_segments(response.choices[0].message.content, len(texts))
+        if translations is None:
+            logger.warning("Malformed batch reply, translating texts individually")
+            return await super().translate_batch(texts, source=source, target=target)
+        return translations
+
+    async def translate_bulk(
+        self, texts: list[str], source: str, target: str, poll_interval: float = 30.0
+    ) -> list[str]:
+        """Translate texts as an OpenAI Batch API job.
+
+        Batch jobs cost less than regular requests but may take up to 24
+        hours, so this suits offline bulk work rather than the clipboard.
+        """
+        if not self.client:
+            raise ValueError("OpenAI client not initialized. Check API key.")
+
+        system = _translation_prompt(
+            self.LANGUAGES.get(source, source), self.LANGUAGES.get(target, target)
+        )
+        requests = "\n".join(
+            json.dumps(
+                {
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self.model,
+                        "messages": [
+                            {"role": "system", "content": system},
+                            {"role": "user", "content": _wrap(text)},
+                        ],
+                        "temperature": 0.3,
+                        "max_tokens": 4096,
+                    },
+                }
+            )
+            for i, text in enumerate(texts)
+        )
+
+        try:
+            input_file = await self.client.files.create(
+                file=("translations.jsonl", requests.encode()), purpose="batch"
+            )
+            batch = await self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+            logger.info(f"Submitted OpenAI batch {batch.id} with {len(texts)} texts")
+
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                await asyncio.sleep(poll_interval)
+                batch = await self.client.batches.retrieve(batch.id)
+
+            if batch.status != "completed" or not batch.output_file_id:
+                raise RuntimeError(f"OpenAI batch {batch.id} {batch.status}")
+            output = await self.client.files.content(batch.output_file_id)
+        except Exception as e:
+            logger.error(f"Bulk translation failed: {e}")
+            raise
+
+        translations = {}
+        for line in output.text.splitlines():
+            if not line:
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") == 200:
+                message = response["body"]["choices"][0]["message"]
+                translations[int(record["custom_id"])] = _unwrap(message["content"])
+
+        # Retry requests that failed inside the batch individually
+        missing = [i for i in range(len(texts)) if i not in translations]
+        if missing:
+            logger.warning(f"Retrying {len(missing)} failed batch requests directly")
+            retried = await self.translate_batch(
+                [texts[i] for i in missing], source=source, target=target
+            )
+            translations.update(zip(missing, retried, strict=True))
+
+        return [translations[i] for i in range(len(texts))]
+
+    async def detect_and_translate(
+        self, text: str, source: str, target: str
+    ) -> tuple[str | None, str]:
+        """Detect the language and translate in a single JSON-mode completion."""
+        if not self.client:
+            raise ValueError("OpenAI client not initialized. Check API key.")
+
+        source_name = None if source == "auto" else self.LANGUAGES.get(source, source)
+        target_name = self.LANGUAGES.get(target, target)
+
+        try:
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": _detect_translate_prompt(source_name, target_name),
+                    },
+                    {"role": "user", "content": text},
+                ],
+                response_format={"type": "json_object"},
+                temperature=0.3,
+                max_tokens=4096,
+            )
+        except Exception as e:
+            logger.error(f"Translation failed: {e}")
+            raise
+
+        parsed = _parse_detect_translate(
+            response.choices[0].message.content, self.LANGUAGES
+        )
+        if parsed is None:
+            logger.warning("Malformed detect-and-translate reply, retrying separately")
+            return await super().detect_and_translate(text, source, target)
+        return parsed
+
+    def get_supported_languages(self) -> Mapping[str, str]:
         """Get dictionary of supported language codes and names."""
         return self.LANGUAGES
 
@@ -218,55 +626,70 @@ class DeepLBackend(TranslationBackend):
     """DeepL translation backend."""
 
     # DeepL language codes
-    LANGUAGES = {
-        "bg": "Bulgarian",
-        "cs": "Czech",
-        "da": "Danish",
-        "de": "German",
-        "el": "Greek",
-        "en": "English",
-        "en-gb": "English (British)",
-        "en-us": "English (American)",
-        "es": "Spanish",
-        "et": "Estonian",
-        "fi": "Finnish",
-        "fr": "French",
-        "hu": "Hungarian",
-        "id": "Indonesian",
-        "it": "Italian",
-        "ja": "Japanese",
-        "ko": "Korean",
-        "lt": "Lithuanian",
-        "lv": "Latvian",
-        "nb": "Norwegian",
-        "nl": "Dutch",
-        "pl": "Polish",
-        "pt": "Portuguese",
-        "pt-br": "Portuguese (Brazilian)",
-        "pt-pt": "Portuguese (European)",
-        "ro": "Romanian",
-        "ru": "Russian",
-        "sk": "Slovak",
-        "sl": "Slovenian",
-        "sv": "Swedish",
-        "tr": "Turkish",
-        "uk": "Ukrainian",
-        "zh": "Chinese (Simplified)",
-        "auto": "Auto-detect",
+    LANGUAGES = MappingProxyType(
+        {
+            "bg": "Bulgarian",
+            "cs": "Czech",
+            "da": "Danish",
+            "de": "German",
+            "el": "Greek",
+            "en": "English",
+            "en-gb": "English (British)",
+            "en-us": "English (American)",
+            "es": "Spanish",
+            "et": "Estonian",
+            "fi": "Finnish",
+            "fr": "French",
+            "hu": "Hungarian",
+            "id": "Indonesian",
+            "it": "Italian",
+            "ja": "Japanese",
+            "ko": "Korean",
+            "lt": "Lithuanian",
+            "lv": "Latvian",
+            "nb": "Norwegian",
+            "nl": "Dutch",
+            "pl": "Polish",
+            "pt": "Portuguese",
+            "pt-br": "Portuguese (Brazilian)",
+            "pt-pt": "Portuguese (European)",
+            "ro": "Romanian",
+            "ru": "Russian",
+            "sk": "Slovak",
+            "sl": "Slovenian",
+            "sv": "Swedish",
+            "tr": "Turkish",
+            "uk": "Ukrainian",
+            "zh": "Chinese (Simplified)",
+            "auto": "Auto-detect",
+        }
+    )
+
+    # Our language codes to DeepL's; source languages take no regional variant
+    _TARGET_MAP = {
+        **{code: code.upper() for code in LANGUAGES},
+        "en": "EN-US",
+        "pt": "PT-PT",
+        "zh-cn": "ZH",
+    }
+    _SOURCE_MAP: dict[str, str | None] = {
+        code: code.split("-")[0].upper() for code in LANGUAGES
     }
+    _SOURCE_MAP["auto"] = None
+
+    # DeepL's detected languages to our codes
+    _DETECTED_MAP = {"en": "en-us", "pt": "pt-pt"}
 
     def __init__(self, api_key: str | None = None):
         self.api_key = api_key or os.getenv("DEEPL_API_KEY")
-        self.translator = None
+        self.translator: Any = None
         self._init_translator()
 
     def _init_translator(self):
         """Initialize DeepL translator."""
         if self.api_key:
             try:
-                import deepl
-
-                self.translator = deepl.Translator(self.api_key)
+                self.translator = _deepl_translator(self.api_key)
             except ImportError:
                 logger.error("DeepL library not installed. Run: pip install deepl")
                 self.translator = None
@@ -279,20 +702,14 @@ class DeepLBackend(TranslationBackend):
         try:
             # DeepL doesn't have a separate detect endpoint
             # We can use translate with target 'en' and check source language
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                lambda: self.translator.translate_text(text[:500], target_lang="EN-US"),
+            result = await asyncio.get_running_loop().run_in_executor(
+                _DEEPL_POOL,
+                functools.partial(
+                    self.translator.translate_text, text[:500], target_lang="EN-US"
+                ),
             )
 
-            # Convert DeepL language code to our standard codes
-            detected = result.detected_source_lang.lower()
-            if detected == "en":
-                detected = "en-us"
-            elif detected == "pt":
-                detected = "pt-pt"
-
-            return detected if detected in self.LANGUAGES else None
+            return self._detected_code(result.detected_source_lang)
 
         except Exception as e:
             logger.error(f"Language detection failed: {e}")
@@ -304,34 +721,73 @@ class DeepLBackend(TranslationBackend):
             raise ValueError("DeepL translator not initialized. Check API key.")
 
         try:
-            # Convert our language codes to DeepL format
-            deepl_target = target.upper()
-            if target == "en":
-                deepl_target = "EN-US"
-            elif target == "pt":
-                deepl_target = "PT-PT"
-            elif target == "zh" or target == "zh-cn":
-                deepl_target = "ZH"
-
-            # DeepL source can be None for auto-detect
-            deepl_source = None if source == "auto" else source.upper()
-
-            # Run translation in executor since deepl library is sync
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                lambda: self.translator.translate_text(
-                    text, source_lang=deepl_source, target_lang=deepl_target
-                ),
-            )
+            result = await self._translate_text(text, source, target)
+            return str(result.text)
 
-            return result.text
+        except Exception as e:
+            logger.error(f"Translation failed: {e}")
+            raise
+
+    async def translate_batch(
+        self, texts: list[str], source: str, target: str
+    ) -> list[str]:
+        """Translate several texts in a single DeepL request."""
+        if not self.translator:
+            raise ValueError("DeepL translator not initialized. Check API key.")
+
+        try:
+            results = await self._translate_text(texts, source, target)
+            return [result.text for result in results]
 
+        except Exception as e:
+            logger.error(f"Batch translation failed: {e}")
+            raise
+
+    async def detect_and_translate(
+        self, text: str, source: str, target: str
+    ) -> tuple[str | None, str]:
+        """Translate with auto-detection and read back the detected language."""
+        # DeepL echoes source_lang back when one is given
+        if source != "auto":
+            return await super().detect_and_translate(text, source, target)
+        if not self.translator:
+            raise ValueError("DeepL translator not initialized. Check API key.")
+
+        try:
+            result = await self._translate_text(text, source, target)
         except Exception as e:
             logger.error(f"Translation failed: {e}")
             raise
 
-    def get_supported_languages(self) -> dict[str, str]:
+        return self._detected_code(result.detected_source_lang), result.text
+
+    def _detected_code(self, deepl_lang: str) -> str | None:
+        """Convert a DeepL detected language to our code, if supported."""
+        detected = deepl_lang.lower()
+        detected = self._DETECTED_MAP.get(detected, detected)
+        return detected if detected in self.LANGUAGES else None
+
+    async def _translate_text(
+        self, text: str | list[str], source: str, target: str
+    ) -> Any:
+        """Call DeepL translate_text with our language codes converted."""
+        # Convert our language codes to DeepL format; the source is None
+        # for auto-detect
+        deepl_target = self._TARGET_MAP.get(target, target.upper())
+        deepl_source = self._SOURCE_MAP.get(source, source.upper())
+
+        # Run translation in executor since deepl library is sync
+        return await asyncio.get_running_loop().run_in_executor(
+            _DEEPL_POOL,
+            functools.partial(
+                self.translator.translate_text,
+                text,
+                source_lang=deepl_source,
+                target_lang=deepl_target,
+            ),
+        )
+
+    def get_supported_languages(self) -> Mapping[str, str]:
         """Get dictionary of supported language codes and names."""
         return self.LANGUAGES
 
@@ -344,14 +800,14 @@ class ClaudeBackend(TranslationBackend):
     """Anthropic Claude translation backend."""
 
     # Use same language set as OpenAI for now
-    LANGUAGES = OpenAIBackend.LANGUAGES.copy()
+    LANGUAGES = OpenAIBackend.LANGUAGES
 
     def __init__(
         self, api_key: str | None = None, model: str = "claude-3-haiku-20240307"
     ):
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         self.model = model
-        self.client = None
+        self.client: Any = None
         self._init_client()
 
     def _init_client(self):
@@ -360,7 +816,10 @@ class ClaudeBackend(TranslationBackend):
             try:
                 from anthropic import AsyncAnthropic
 
-                self.client = AsyncAnthropic(api_key=self.api_key)
+                self.client = _shared_client(
+                    ("claude", self.api_key),
+                    lambda: AsyncAnthropic(api_key=self.api_key),
+                )
             except ImportError:
                 logger.error(
                     "Anthropic library not installed. Run: pip install anthropic"
@@ -397,6 +856,8 @@ class ClaudeBackend(TranslationBackend):
         """Translate text from source to target language."""
         if not self.client:
             raise ValueError("Claude client not initialized. Check API key.")
+        if not text.strip():
+            return ""
 
         source_name = self.LANGUAGES.get(source, source)
         target_name = self.LANGUAGES.get(target, target)
@@ -406,17 +867,102 @@ class ClaudeBackend(TranslationBackend):
                 model=self.model,
                 max_tokens=4096,
                 temperature=0.3,
-                system=f"You are a professional translator. Translate text from {source_name} to {target_name}. Maintain the original formatting and style. Only provide the translation, no explanations.",
-                messages=[{"role": "user", "content": text}],
+                system=_translation_prompt(source_name, target_name),
+                messages=[{"role": "user", "content": _wrap(text)}],
             )
 
-            return response.content[0].text.strip()
+            return _unwrap(response.content[0].text)
 
         except Exception as e:
             logger.error(f"Translation failed: {e}")
             raise
 
-    def get_supported_languages(self) -> dict[str, str]:
+    async def translate_stream(
+        self, text: str, source: str, target: str
+    ) -> AsyncIterator[str]:
+        """Translate text, yielding pieces of the translation as they arrive."""
+        if not self.client:
+            raise ValueError("Claude client not initialized. Check API key.")
+        if not text.strip():
+            return
+
+        source_name = self.LANGUAGES.get(source, source)
+        target_name = self.LANGUAGES.get(target, target)
+
+        try:
+            async with self.client.messages.stream(
+                model=self.model,
+                max_tokens=4096,
+                temperature=0.3,
+                system=_translation_prompt(source_name, target_name),
+                messages=[{"role": "user", "content": _wrap(text)}],
+            ) as stream:
+                async for piece in stream.text_stream:
+                    yield piece
+
+        except Exception as e:
+            logger.error(f"Translation failed: {e}")
+            raise
+
+    async def translate_batch(
+        self, texts: list[str], source: str, target: str
+    ) -> list[str]:
+        """Translate several texts in a single message."""
+        if len(texts) < 2:
+            return await super().translate_batch(texts, source=source, target=target)
+        if not self.client:
+            raise ValueError("Claude client not initialized. Check API key.")
+
+        source_name = self.LANGUAGES.get(source, source)
+        target_name = self.LANGUAGES.get(target, target)
+
+        try:
+            response = await self.client.messages.create(
+                model=self.model,
+                max_tokens=4096,
+                temperature=0.3,
+                system=_batch_prompt(source_name, target_name),
+                messages=[{"role": "user", "content": _join_segments(texts)}],
+            )
+        except Exception as e:
+            logger.error(f"Batch translation failed: {e}")
+            raise
+
+        translations = _split_segments(response.content[0].text, len(texts))
+        if translations is None:
+            logger.warning("Malformed batch reply, translating texts individually")
+            return await super().translate_batch(texts, source=source, target=target)
+        return translations
+
+    async def detect_and_translate(
+        self, text: str, source: str, target: str
+    ) -> tuple[str | None, str]:
+        """Detect the language and translate in a single JSON reply."""
+        if not self.client:
+            raise ValueError("Claude client not initialized. Check API key.")
+
+        source_name = None if source == "auto" else self.LANGUAGES.get(source, source)
+        target_name = self.LANGUAGES.get(target, target)
+
+        try:
+            response = await self.client.messages.create(
+                model=self.model,
+                max_tokens=4096,
+                temperature=0.3,
+                system=_detect_translate_prompt(source_name, target_name),
+                messages=[{"role": "user", "content": text}],
+            )
+        except Exception as e:
+            logger.error(f"Translation failed: {e}")
+            raise
+
+        parsed = _parse_detect_translate(response.content[0].text, self.LANGUAGES)
+        if parsed is None:
+            logger.warning("Malformed detect-and-translate reply, retrying separately")
+            return await super().detect_and_translate(text, source, target)
+        return parsed
+
+    def get_supported_languages(self) -> Mapping[str, str]:
         """Get dictionary of supported language codes and names."""
         return self.LANGUAGES
 
@@ -425,17 +971,27 @@ class ClaudeBackend(TranslationBackend):
         return bool(self.api_key and self.client)
 
 
-def get_backend(engine: str, **kwargs) -> TranslationBackend:
-    """Factory function to get translation backend."""
+def get_backend_class(engine: str) -> type[TranslationBackend]:
+    """Get the translation backend class for an engine name."""
     engine = engine.lower()
 
     if engine == "google":
-        return GoogleTranslateBackend()
+        return GoogleTranslateBackend
     elif engine == "openai":
-        return OpenAIBackend(**kwargs)
+        return OpenAIBackend
     elif engine == "deepl":
-        return DeepLBackend(**kwargs)
+        return DeepLBackend
     elif engine == "claude":
-        return ClaudeBackend(**kwargs)
+        return ClaudeBackend
     else:
         raise ValueError(f"Unknown translation engine: {engine}")
+
+
+def get_backend(engine: str, **kwargs) -> TranslationBackend:
+    """Factory function to get translation backend."""
+    backend_class = get_backend_class(engine)
+
+    # Google Translate takes no configuration
+    if backend_class is GoogleTranslateBackend:
+        return backend_class()
+    return backend_class(**kwargs)
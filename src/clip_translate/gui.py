@@ -2,14 +2,19 @@
 
 import sys
 import asyncio
-from typing import Optional
+import functools
+import re
+import threading
+from collections.abc import Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager
 from PyQt6.QtWidgets import (
     QApplication,
     QMainWindow,
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
-    QTextEdit,
+    QPlainTextEdit,
     QLabel,
     QComboBox,
     QPushButton,
@@ -22,28 +27,224 @@ from PyQt6.QtCore import (
     Qt,
     QTimer,
     pyqtSignal,
-    QThread,
+    QObject,
     QPoint,
-    QRect,
-    QPropertyAnimation,
-    QEasingCurve,
     pyqtSlot,
+    QSocketNotifier,
 )
-from PyQt6.QtGui import QFont, QClipboard, QPalette, QColor
-import pyperclip
+from PyQt6.QtGui import QMouseEvent
+from PyQt6 import sip
 from loguru import logger
 
 from clip_translate.core import TranslationEngine, get_supported_languages
+from clip_translate.clipboard import change_counter
 from clip_translate.config import Config
-from clip_translate.settings_dialog import SettingsDialog
+from clip_translate.engines import close_shared_clients
+
+# Clipboard text that is only a URL or numbers, with nothing to translate
+_UNTRANSLATABLE = re.compile(r"\s*(?:https?://\S+|[\d\s.,:;/+-]+)\s*")
+
+# Log templates for clipboard text and translations. loguru only formats
+# the arguments into them when a sink accepts the message
+_RULE = "=" * 60
+_THIN_RULE = "-" * 60
+_CLIPBOARD_LOG = "\n" + _RULE + "\n📋 NEW CLIPBOARD CONTENT:\n{}\n" + _THIN_RULE
+_MANUAL_INPUT_LOG = "\n" + _RULE + "\n✍️  MANUAL INPUT:\n{}\n" + _THIN_RULE
+_TRANSLATION_LOG = "\n🔄 TRANSLATION {}:\n{}\n" + _RULE
+
+
+@functools.cache
+def _language_items() -> tuple[tuple[str, str], ...]:
+    """Get the (display name, code) language combo items, sorted by code."""
+    return tuple(
+        (f"{name} ({code})", code)
+        for code, name in sorted(get_supported_languages().items())
+    )
 
 
-class TranslationWorker(QThread):
-    """Background worker thread for translations."""
+@functools.cache
+def _language_index() -> dict[str, int]:
+    """Map language codes to their position in the language combos."""
+    return {code: i for i, (_, code) in enumerate(_language_items())}
+
+
+# Application-wide style, parsed once per process
+_STYLESHEET = """
+#centralWidget {
+    background-color: rgba(64, 64, 64, 240);
+    border-radius: 12px;
+    border: 1px solid rgba(60, 60, 60, 200);
+}
+
+QGroupBox {
+    color: #ffffff;
+    font-weight: bold;
+    border: 1px solid rgba(80, 80, 80, 150);
+    border-radius: 6px;
+    margin-top: 6px;
+    padding-top: 10px;
+}
+
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px 0 5px;
+}
+
+QPlainTextEdit {
+    background-color: rgba(45, 45, 45, 200);
+    color: #ffffff;
+    border: 1px solid rgba(70, 70, 70, 150);
+    border-radius: 4px;
+    padding: 5px;
+    font-family: 'Menlo', 'Monaco', 'Consolas', monospace;
+    font-size: 14px;
+}
+
+/* Text areas are non-selectable */
+
+QComboBox {
+    background-color: rgba(150, 150, 150, 200);
+    color: #ffffff;
+    border: 1px solid rgba(70, 70, 70, 150);
+    border-radius: 4px;
+    padding: 4px;
+    min-width: 100px;
+}
+
+QComboBox::drop-down {
+    border: none;
+}
+
+QComboBox::down-arrow {
+    image: none;
+    border-left: 5px solid transparent;
+    border-right: 5px solid transparent;
+    border-top: 5px solid #ffffff;
+    margin-right: 5px;
+}
+
+QComboBox QAbstractItemView {
+    background-color: rgba(10, 14, 6, 0.47);
+    color: #803232;
+    selection-background-color: rgba(70, 130, 180, 200);
+    selection-color: #ffffff;
+}
+
+QComboBox QAbstractItemView::item {
+    color: #803232;
+    background-color: rgba(10, 14, 6, 0.47);
+    padding: 4px;
+}
+
+QComboBox QAbstractItemView::item:hover {
+    color: #803232;
+    background-color: rgba(255, 169, 70, 0.99);
+}
+
+QComboBox QAbstractItemView::item:selected {
+    background-color: rgba(70, 130, 180, 200);
+    color: #ffffff;
+}
+
+QPushButton {
+    background-color: rgba(70, 130, 180, 200);
+    color: #ffffff;
+    border: none;
+    border-radius: 4px;
+    padding: 6px 12px;
+    font-weight: bold;
+}
+
+QPushButton:hover {
+    background-color: rgba(100, 149, 237, 200);
+}
+
+QPushButton:pressed {
+    background-color: rgba(65, 105, 225, 200);
+}
+
+QLabel {
+    color: #ffffff;
+}
+
+QCheckBox {
+    color: #ffffff;
+}
+
+QCheckBox::indicator {
+    width: 16px;
+    height: 16px;
+    border-radius: 3px;
+    border: 1px solid rgba(70, 70, 70, 150);
+    background-color: rgba(45, 45, 45, 200);
+}
+
+QCheckBox::indicator:checked {
+    background-color: rgba(70, 130, 180, 200);
+}
+
+QSlider::groove:horizontal {
+    height: 4px;
+    background: rgba(70, 70, 70, 150);
+    border-radius: 2px;
+}
+
+QSlider::handle:horizontal {
+    background: rgba(70, 130, 180, 200);
+    width: 12px;
+    height: 12px;
+    border-radius: 6px;
+    margin: -4px 0;
+}
+
+#readingText {
+    background-color: rgba(60, 45, 45, 200);
+    color: #DDA0DD;
+    font-style: italic;
+}
+
+#closeButton {
+    background-color: rgba(255, 59, 48, 200);
+}
+
+#closeButton:hover {
+    background-color: rgba(255, 69, 58, 250);
+}
+
+#titleBar {
+    background-color: rgba(40, 40, 40, 200);
+    border-top-left-radius: 12px;
+    border-top-right-radius: 12px;
+}
+"""
+
+
+@contextmanager
+def _batch_updates(*widgets: QWidget | None) -> Iterator[None]:
+    """Suspend repaints of the widgets while they are updated together."""
+    present = [widget for widget in widgets if widget is not None]
+    for widget in present:
+        widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        for widget in present:
+            widget.setUpdatesEnabled(True)
+
+
+class TranslationWorker(QObject):
+    """Translates in the background on a long-lived asyncio event loop.
+
+    The loop runs on one daemon thread for the whole session, so HTTP
+    clients stay warm between translations. Signals are emitted from that
+    thread and queued to the GUI thread by Qt.
+    """
 
     translation_ready = pyqtSignal(str, str, bool)  # translated, original, cached
     error_occurred = pyqtSignal(str)
     language_detected = pyqtSignal(str)
+    reading_ready = pyqtSignal(str)
 
     def __init__(self, config: Config):
         super().__init__()
@@ -51,89 +252,137 @@ class TranslationWorker(QThread):
         self.config = config
         self.source_lang = "ja"
         self.target_lang = "en"
-        self.text_to_translate = ""
-        self.running = False
-        self.manual_mode = False
-        self._loop = None
+        self.reading_enabled = False
+        self.reading_romaji = False
+        # Check clipboard text is in the source language before showing it
+        self.verify_lang = True
+        self._loop = asyncio.new_event_loop()
+        self._current: Future[None] | None = None
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="translation", daemon=True
+        )
+        self._thread.start()
 
     def set_languages(self, source: str, target: str):
         """Set source and target languages."""
         self.source_lang = source
         self.target_lang = target
 
-    def translate(self, text: str, manual: bool = False):
-        """Queue text for translation."""
-        self.text_to_translate = text
-        self.manual_mode = manual
-        if not self.isRunning():
-            self.start()
+    def set_reading(self, enabled: bool, romaji: bool = False) -> None:
+        """Set whether Japanese readings are generated, and in which script."""
+        self.reading_enabled = enabled
+        self.reading_romaji = romaji
+
+    def translate(self, text: str, manual: bool = False) -> None:
+        """Queue text for translation, cancelling any still in flight."""
+        # Only the newest text is shown, so a stale request is not worth
+        # waiting for
+        if self._current is not None:
+            self._current.cancel()
+        self._current = asyncio.run_coroutine_threadsafe(
+            self._translate(text, self.source_lang, self.target_lang, manual),
+            self._loop,
+        )
+
+    def stop(self) -> None:
+        """Stop the event loop and wait briefly for its thread to exit."""
+        if self._loop.is_closed():
+            return
+        if self._current is not None:
+            self._current.cancel()
 
-    def run(self):
-        """Run translation in background thread."""
+        # Close pooled connections on the loop that owns them
         try:
-            # Create a fresh event loop for this thread
-            if self._loop is None or self._loop.is_closed():
-                self._loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self._loop)
-
-            # Detect language first
-            detected = self._loop.run_until_complete(
-                self.engine.detect_language(self.text_to_translate)
+            asyncio.run_coroutine_threadsafe(close_shared_clients(), self._loop).result(
+                timeout=1
             )
+        except Exception as e:
+            logger.debug(f"Failed to close HTTP clients: {e}")
+
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(1)
+        if not self._thread.is_alive():
+            self._loop.close()
+
+    async def _translate(
+        self, text: str, source: str, target: str, manual: bool
+    ) -> None:
+        """Detect and translate text, reporting the result through signals."""
+        # Detection only decides whether to show the translation, so skip it
+        # when nothing would be filtered
+        verify = self.verify_lang and source != "auto" and not manual
+        try:
+            try:
+                if verify:
+                    # Detect and translate together, in one request where
+                    # the engine supports it
+                    detection = await self.engine.detect_and_translate(
+                        text, source, target
+                    )
+                    detected, translated, original, cached = detection
+                else:
+                    detected = None
+                    translation = await self.engine.translate_text(text, source, target)
+                    translated, original, cached = translation
+            except Exception as trans_error:
+                logger.error(f"Translation error: {trans_error}")
+                self.error_occurred.emit(f"Translation failed: {trans_error}")
+                return
 
             if detected:
                 self.language_detected.emit(detected)
-                logger.info(
-                    f"Language detected: {detected} (expected: {self.source_lang})"
-                )
-
-                # Only translate if language matches OR if source is 'auto'
-                if (
-                    detected == self.source_lang
-                    or self.source_lang == "auto"
-                    or self.manual_mode
-                ):
-                    try:
-                        translated, original, cached = self._loop.run_until_complete(
-                            self.engine.translate_text(
-                                self.text_to_translate,
-                                self.source_lang
-                                if self.source_lang != "auto"
-                                else detected,
-                                self.target_lang,
-                            )
-                        )
-                        # Translation logging moved to on_translation_ready for better formatting
-                        self.translation_ready.emit(translated, original, cached)
-                    except Exception as trans_error:
-                        logger.error(f"Translation error: {trans_error}")
-                        self.error_occurred.emit(f"Translation failed: {trans_error}")
-                else:
-                    skip_msg = (
-                        f"Skipped: Detected '{detected}', expected '{self.source_lang}'"
-                    )
-                    logger.info(skip_msg)
-                    self.error_occurred.emit(skip_msg)
+                logger.info("Language detected: {} (expected: {})", detected, source)
+
+            # Only show the translation if the language matches or the
+            # language check is off
+            if not verify or detected == source:
+                # Translation logging moved to on_translation_ready for better formatting
+                self.translation_ready.emit(translated, original, cached)
+                if self.reading_enabled:
+                    await self._emit_reading(original)
+            elif detected:
+                skip_msg = f"Skipped: Detected '{detected}', expected '{source}'"
+                logger.info(skip_msg)
+                self.error_occurred.emit(skip_msg)
             else:
                 self.error_occurred.emit("Language detection failed")
 
         except Exception as e:
             logger.error(f"Translation worker error: {e}")
             self.error_occurred.emit(f"Worker error: {str(e)}")
-        finally:
-            # Don't close the loop, keep it for reuse
-            pass
+
+    async def _emit_reading(self, text: str) -> None:
+        """Generate the Japanese reading for text and report it."""
+        # kakasi is synchronous, so convert in a thread to keep the loop free
+        # to start and cancel translations while long texts are converted
+        try:
+            reading = await asyncio.to_thread(
+                self.engine.get_japanese_reading,
+                text,
+                romaji=self.reading_romaji,
+                hiragana=not self.reading_romaji,
+            )
+        except Exception as e:
+            logger.error(f"Failed to generate reading: {e}")
+            self.reading_ready.emit("(Reading generation failed)")
+            return
+        self.reading_ready.emit(reading or "(No Japanese text found)")
 
 
 class FloatingTranslator(QMainWindow):
     """Main floating window for translation."""
 
+    # Quiet period before translating, so bursts of clipboard writes
+    # only translate the last text
+    CLIPBOARD_DEBOUNCE_MS = 150
+
     def __init__(
         self,
         source_lang: str = "ja",
         target_lang: str = "en",
         show_romaji: bool = False,
         show_hiragana: bool = False,
+        verify_lang: bool = True,
     ):
         super().__init__()
         self.config = Config()
@@ -142,11 +391,22 @@ class FloatingTranslator(QMainWindow):
         self.show_romaji = show_romaji
         self.show_hiragana = show_hiragana
         self.translation_worker = TranslationWorker(self.config)
+        self.translation_worker.verify_lang = verify_lang
         self.clipboard_timer = QTimer()
+        self.debounce_timer = QTimer()
+        self.debounce_timer.setSingleShot(True)
         self.last_clipboard_text = ""
+        # Where the platform counts clipboard changes, unchanged polls skip
+        # reading the clipboard text at all
+        self.clipboard_change_count = change_counter()
+        self.last_change_count: int | None = None
+        self.pending_text = ""
         self.is_monitoring = False
         self.is_closing = False  # Flag to prevent operations during shutdown
         self.is_manual_mode = False  # Flag for manual input mode
+        self.drag_position: QPoint | None = None
+        # Readings are only shown for Japanese source text
+        self.reading_enabled = source_lang == "ja" and (show_romaji or show_hiragana)
         self.init_ui()
         self.setup_connections()
 
@@ -154,7 +414,7 @@ class FloatingTranslator(QMainWindow):
         self.set_language_selection()
 
         # Setup Japanese converter if needed
-        if self.source_lang == "ja" and (self.show_romaji or self.show_hiragana):
+        if self.reading_enabled:
             self.translation_worker.engine.setup_japanese_converter()
 
         # Show current engine in status
@@ -198,37 +458,10 @@ class FloatingTranslator(QMainWindow):
         self.swap_btn.setMaximumWidth(30)
 
         # Populate language combos
-        languages = get_supported_languages()
-        for code, name in sorted(languages.items()):
-            display = f"{name} ({code})"
+        for display, code in _language_items():
             self.source_combo.addItem(display, code)
             self.target_combo.addItem(display, code)
 
-        # Force the dropdown styling on ComboBoxes
-        combo_dropdown_style = """
-            QComboBox QAbstractItemView {
-                background-color: rgba(10, 14, 6, 0.47);
-                color: #803232;
-                selection-background-color: rgba(70, 130, 180, 200);
-                selection-color: #ffffff;
-            }
-            QComboBox QAbstractItemView::item {
-                color: #803232;
-                background-color: rgba(10, 14, 6, 0.47);
-                padding: 4px;
-            }
-            QComboBox QAbstractItemView::item:hover {
-                color: #803232;
-                background-color: rgba(255, 169, 70, 0.99);
-            }
-            QComboBox QAbstractItemView::item:selected {
-                background-color: rgba(70, 130, 180, 200);
-                color: #ffffff;
-            }
-        """
-        self.source_combo.setStyleSheet(combo_dropdown_style)
-        self.target_combo.setStyleSheet(combo_dropdown_style)
-
         # Defaults will be set in set_language_selection()
 
         from_label = QLabel("From:")
@@ -263,7 +496,7 @@ class FloatingTranslator(QMainWindow):
         input_controls_layout.addStretch()
         original_layout.addLayout(input_controls_layout)
 
-        self.original_text = QTextEdit()
+        self.original_text = QPlainTextEdit()
         self.original_text.setReadOnly(True)
         self.original_text.setMinimumHeight(150)
         self.original_text.setMaximumHeight(200)
@@ -274,9 +507,11 @@ class FloatingTranslator(QMainWindow):
         original_layout.addWidget(self.original_text)
 
         # Add reading text area if Japanese readings are enabled
-        if self.source_lang == "ja" and (self.show_romaji or self.show_hiragana):
+        self.reading_label: QLabel | None = None
+        self.reading_text: QPlainTextEdit | None = None
+        if self.reading_enabled:
             reading_label = "Romaji" if self.show_romaji else "Hiragana"
-            self.reading_text = QTextEdit()
+            self.reading_text = QPlainTextEdit()
             self.reading_text.setReadOnly(True)
             self.reading_text.setMinimumHeight(60)
             self.reading_text.setMaximumHeight(100)
@@ -284,24 +519,17 @@ class FloatingTranslator(QMainWindow):
             self.reading_text.setTextInteractionFlags(
                 Qt.TextInteractionFlag.NoTextInteraction
             )
-            self.reading_text.setStyleSheet("""
-                QTextEdit {
-                    background-color: rgba(60, 45, 45, 200);
-                    color: #DDA0DD;
-                    font-style: italic;
-                }
-            """)
-            original_layout.addWidget(QLabel(f"{reading_label} Reading:"))
+            self.reading_text.setObjectName("readingText")
+            self.reading_label = QLabel(f"{reading_label} Reading:")
+            original_layout.addWidget(self.reading_label)
             original_layout.addWidget(self.reading_text)
-        else:
-            self.reading_text = None
 
         original_group.setLayout(original_layout)
 
         # Translation
         translation_group = QGroupBox("Translation")
         translation_layout = QVBoxLayout()
-        self.translation_text = QTextEdit()
+        self.translation_text = QPlainTextEdit()
         self.translation_text.setReadOnly(True)
         self.translation_text.setMinimumHeight(150)
         # Make text non-selectable to prevent CMD+C freezing
@@ -353,146 +581,6 @@ class FloatingTranslator(QMainWindow):
 
         main_layout.addLayout(opacity_layout)
 
-        # Apply styles
-        self.setStyleSheet("""
-            #centralWidget {
-                background-color: rgba(64, 64, 64, 240);
-                border-radius: 12px;
-                border: 1px solid rgba(60, 60, 60, 200);
-            }
-            
-            QGroupBox {
-                color: #ffffff;
-                font-weight: bold;
-                border: 1px solid rgba(80, 80, 80, 150);
-                border-radius: 6px;
-                margin-top: 6px;
-                padding-top: 10px;
-            }
-            
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-            
-            QTextEdit {
-                background-color: rgba(45, 45, 45, 200);
-                color: #ffffff;
-                border: 1px solid rgba(70, 70, 70, 150);
-                border-radius: 4px;
-                padding: 5px;
-                font-family: 'Menlo', 'Monaco', 'Consolas', monospace;
-                font-size: 14px;
-            }
-            
-            /* Text areas are non-selectable */
-            
-            QComboBox {
-                background-color: rgba(150, 150, 150, 200);
-                color: #ffffff;
-                border: 1px solid rgba(70, 70, 70, 150);
-                border-radius: 4px;
-                padding: 4px;
-                min-width: 100px;
-            }
-            
-            QComboBox::drop-down {
-                border: none;
-            }
-            
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid #ffffff;
-                margin-right: 5px;
-            }
-            
-            QComboBox QAbstractItemView {
-                background-color: rgba(255, 169, 70, 0.99); # background color of list items
-                color: #803232;
-                selection-background-color: rgba(255, 169, 70, 0.99); # rgba(70, 130, 180, 200);
-                selection-color: #803232;
-                border: 1px solid rgba(70, 70, 70, 150);
-                border-radius: 4px;
-                padding: 2px;
-            }
-            
-            QComboBox QAbstractItemView::item {
-                color: #803232;
-                background-color: rgba(255, 169, 70, 0.99);
-                padding: 4px;
-            }
-            
-            QComboBox QAbstractItemView::item:hover {
-                color: #803232;
-                background-color: rgba(255, 169, 70, 0.99);
-            }
-            
-            QComboBox QAbstractItemView::item:selected {
-                background-color: rgba(70, 130, 180, 200);
-                color: #ffffff;
-            }
-            
-            QPushButton {
-                background-color: rgba(70, 130, 180, 200);
-                color: #ffffff;
-                border: none;
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-weight: bold;
-            }
-            
-            QPushButton:hover {
-                background-color: rgba(100, 149, 237, 200);
-            }
-            
-            QPushButton:pressed {
-                background-color: rgba(65, 105, 225, 200);
-            }
-            
-            QLabel {
-                color: #ffffff;
-            }
-            
-            QCheckBox {
-                color: #ffffff;
-            }
-            
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-                border-radius: 3px;
-                border: 1px solid rgba(70, 70, 70, 150);
-                background-color: rgba(45, 45, 45, 200);
-            }
-            
-            QCheckBox::indicator:checked {
-                background-color: rgba(70, 130, 180, 200);
-            }
-            
-            QSlider::groove:horizontal {
-                height: 4px;
-                background: rgba(70, 70, 70, 150);
-                border-radius: 2px;
-            }
-            
-            QSlider::handle:horizontal {
-                background: rgba(70, 130, 180, 200);
-                width: 12px;
-                height: 12px;
-                border-radius: 6px;
-                margin: -4px 0;
-            }
-            
-            #titleBar {
-                background-color: rgba(40, 40, 40, 200);
-                border-top-left-radius: 12px;
-                border-top-right-radius: 12px;
-            }
-        """)
-
     def create_title_bar(self) -> QWidget:
         """Create custom title bar for dragging."""
         title_bar = QWidget()
@@ -516,14 +604,7 @@ class FloatingTranslator(QMainWindow):
 
         close_btn = QPushButton("×")
         close_btn.setMaximumSize(20, 20)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(255, 59, 48, 200);
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 69, 58, 250);
-            }
-        """)
+        close_btn.setObjectName("closeButton")
         close_btn.clicked.connect(self.close)  # This will trigger closeEvent
 
         layout.addWidget(title)
@@ -536,22 +617,16 @@ class FloatingTranslator(QMainWindow):
 
     def set_language_selection(self):
         """Set the language combo boxes to the specified languages."""
-        languages = get_supported_languages()
-
-        # Find and set source language
-        for i in range(self.source_combo.count()):
-            if self.source_combo.itemData(i) == self.source_lang:
-                self.source_combo.setCurrentIndex(i)
-                break
-
-        # Find and set target language
-        for i in range(self.target_combo.count()):
-            if self.target_combo.itemData(i) == self.target_lang:
-                self.target_combo.setCurrentIndex(i)
-                break
-
-        # Update the worker with the languages
+        index = _language_index()
+        if self.source_lang in index:
+            self.source_combo.setCurrentIndex(index[self.source_lang])
+        if self.target_lang in index:
+            self.target_combo.setCurrentIndex(index[self.target_lang])
+
+        # Update the worker with the languages; later changes reach it
+        # through the combos' change signals
         self.translation_worker.set_languages(self.source_lang, self.target_lang)
+        self.translation_worker.set_reading(self.reading_enabled, self.show_romaji)
 
     def setup_connections(self):
         """Setup signal/slot connections."""
@@ -559,6 +634,7 @@ class FloatingTranslator(QMainWindow):
         self.translation_worker.translation_ready.connect(self.on_translation_ready)
         self.translation_worker.error_occurred.connect(self.on_translation_error)
         self.translation_worker.language_detected.connect(self.on_language_detected)
+        self.translation_worker.reading_ready.connect(self.on_reading_ready)
 
         # UI signals
         self.monitor_checkbox.stateChanged.connect(self.toggle_monitoring)
@@ -570,9 +646,20 @@ class FloatingTranslator(QMainWindow):
         self.input_mode_btn.clicked.connect(self.toggle_input_mode)
         self.translate_btn.clicked.connect(self.translate_manual_input)
 
-        # Clipboard timer
-        self.clipboard_timer.timeout.connect(self.check_clipboard)
-        self.clipboard_timer.start(500)  # Check every 500ms
+        self.debounce_timer.timeout.connect(self.translate_pending)
+
+        # Clipboard changes are signalled by the windowing system
+        clipboard = QApplication.clipboard()
+        if clipboard is None:
+            raise RuntimeError("Clipboard is unavailable without a QApplication")
+        self.clipboard = clipboard
+        self.clipboard.dataChanged.connect(self.check_clipboard)
+
+        # Qt on macOS only notices clipboard changes made by other apps when
+        # the window is activated, so keep polling there
+        if sys.platform == "darwin":
+            self.clipboard_timer.timeout.connect(self.check_clipboard)
+            self.clipboard_timer.start(500)
 
         # Start monitoring
         self.toggle_monitoring(Qt.CheckState.Checked.value)
@@ -600,17 +687,10 @@ class FloatingTranslator(QMainWindow):
         """Copy translation to clipboard without triggering monitor."""
         text = self.translation_text.toPlainText()
         if text:
-            # Temporarily disable monitoring to prevent loop
-            was_monitoring = self.is_monitoring
-            self.is_monitoring = False
-
-            # Copy text and update last clipboard text to prevent re-translation
-            pyperclip.copy(text)
+            # Update last clipboard text first, so the change signal this
+            # triggers is not taken for new content to translate
             self.last_clipboard_text = text
-
-            # Re-enable monitoring after a short delay
-            if was_monitoring:
-                QTimer.singleShot(100, lambda: setattr(self, "is_monitoring", True))
+            self.clipboard.setText(text)
 
             # Visual feedback
             self.copy_translation_btn.setText("Copied!")
@@ -619,15 +699,23 @@ class FloatingTranslator(QMainWindow):
             )
 
             # Keep the text visible - don't clear anything
-            logger.info(f"\n📋 Copied translation to clipboard")
+            logger.info("\n📋 Copied translation to clipboard")
 
     @pyqtSlot()
     def swap_languages(self):
         """Swap source and target languages."""
         source_idx = self.source_combo.currentIndex()
         target_idx = self.target_combo.currentIndex()
+
+        # Swap both combos before updating, so the worker never sees the
+        # intermediate state with source and target the same
+        self.source_combo.blockSignals(True)
+        self.target_combo.blockSignals(True)
         self.source_combo.setCurrentIndex(target_idx)
         self.target_combo.setCurrentIndex(source_idx)
+        self.source_combo.blockSignals(False)
+        self.target_combo.blockSignals(False)
+        self.update_languages()
 
     @pyqtSlot()
     def update_languages(self):
@@ -637,6 +725,13 @@ class FloatingTranslator(QMainWindow):
         if source and target:
             self.translation_worker.set_languages(source, target)
 
+        # Hide the reading pane while the source is not Japanese
+        if self.reading_label is not None and self.reading_text is not None:
+            self.reading_enabled = source == "ja"
+            self.reading_label.setVisible(self.reading_enabled)
+            self.reading_text.setVisible(self.reading_enabled)
+        self.translation_worker.set_reading(self.reading_enabled, self.show_romaji)
+
     @pyqtSlot()
     def toggle_input_mode(self):
         """Toggle between clipboard monitoring and manual input mode."""
@@ -659,10 +754,7 @@ class FloatingTranslator(QMainWindow):
             )
 
             # Clear any existing text
-            self.original_text.clear()
-            self.translation_text.clear()
-            if self.reading_text:
-                self.reading_text.clear()
+            self.clear_text_areas()
 
             current_engine = self.config.get_engine()
             self.status_label.setText(f"Manual Input Mode - Engine: {current_engine}")
@@ -683,10 +775,7 @@ class FloatingTranslator(QMainWindow):
             self.original_text.setPlaceholderText("")
 
             # Clear text areas
-            self.original_text.clear()
-            self.translation_text.clear()
-            if self.reading_text:
-                self.reading_text.clear()
+            self.clear_text_areas()
 
             current_engine = self.config.get_engine()
             self.status_label.setText(f"Monitoring... - Engine: {current_engine}")
@@ -709,11 +798,8 @@ class FloatingTranslator(QMainWindow):
         self.status_label.setText("Translating...")
         self.status_label.setStyleSheet("color: #87CEEB;")
 
-        # Update languages before translating
-        self.update_languages()
-
         # Trigger translation
-        logger.info("\n" + "=" * 60 + "\n" + f"✍️  MANUAL INPUT:\n{text}\n" + "-" * 60)
+        logger.info(_MANUAL_INPUT_LOG, text)
         self.translation_worker.translate(text, manual=True)
 
     def check_clipboard(self):
@@ -722,64 +808,80 @@ class FloatingTranslator(QMainWindow):
             return
 
         try:
-            current_text = pyperclip.paste()
+            if self.clipboard_change_count is not None:
+                count = self.clipboard_change_count()
+                if count == self.last_change_count:
+                    return
+                self.last_change_count = count
+
+            current_text = self.clipboard.text()
             if current_text and current_text != self.last_clipboard_text:
-                logger.info(
-                    "\n"
-                    + "=" * 60
-                    + "\n"
-                    + f"📋 NEW CLIPBOARD CONTENT:\n{current_text}\n"
-                    + "-" * 60
-                )
+                previous_text = self.last_clipboard_text
                 self.last_clipboard_text = current_text
-
-                # Don't show text in original area yet - wait for language detection
-                self.original_text.clear()
-                self.translation_text.clear()
-                if self.reading_text:
-                    self.reading_text.clear()
-                self.status_label.setText("Detecting language...")
-                self.status_label.setStyleSheet("color: #87CEEB;")
-
-                # Update languages before translating
-                self.update_languages()
-
-                # Trigger translation (which includes language detection)
-                # Language info logged in translation worker
-                self.translation_worker.translate(current_text)
+                # Re-copying the same passage with different surrounding
+                # whitespace would translate to the same result
+                if current_text.strip() == previous_text.strip():
+                    return
+                if self.is_noop(current_text):
+                    self.debounce_timer.stop()
+                    self.status_label.setText("Skipped (no-op)")
+                    self.status_label.setStyleSheet("color: #FFD700;")
+                    return
+
+                self.pending_text = current_text
+                self.debounce_timer.start(self.CLIPBOARD_DEBOUNCE_MS)
         except Exception as e:
             if not self.is_closing:
                 logger.error(f"Clipboard check error: {e}")
                 self.status_label.setText("Clipboard error")
                 self.status_label.setStyleSheet("color: #FF6B6B;")
 
+    def clear_text_areas(self) -> None:
+        """Clear the original, reading and translation areas in one repaint."""
+        with _batch_updates(
+            self.original_text, self.translation_text, self.reading_text
+        ):
+            self.original_text.clear()
+            self.translation_text.clear()
+            if self.reading_text:
+                self.reading_text.clear()
+
+    def is_noop(self, text: str) -> bool:
+        """Check whether translating the text would be a wasted request."""
+        return (
+            not text.strip()
+            or self.source_combo.currentData() == self.target_combo.currentData()
+            or _UNTRANSLATABLE.fullmatch(text) is not None
+        )
+
+    @pyqtSlot()
+    def translate_pending(self) -> None:
+        """Translate the latest clipboard text once changes have settled."""
+        if not self.is_monitoring or self.is_closing or self.is_manual_mode:
+            return
+
+        current_text = self.pending_text
+        logger.info(_CLIPBOARD_LOG, current_text)
+
+        # Don't show text in original area yet - wait for language detection
+        self.clear_text_areas()
+        self.status_label.setText("Detecting language...")
+        self.status_label.setStyleSheet("color: #87CEEB;")
+
+        # Trigger translation (which includes language detection)
+        # Language info logged in translation worker
+        self.translation_worker.translate(current_text)
+
     @pyqtSlot(str, str, bool)
     def on_translation_ready(self, translated, original, cached):
         """Handle translation result."""
-        # In manual mode, preserve the user's input text instead of replacing it
-        if not self.is_manual_mode:
-            # Now show both original and translated text
-            self.original_text.setPlainText(original)
-        # Always update the translation
-        self.translation_text.setPlainText(translated)
-
-        # Show Japanese reading if enabled and available
-        if (
-            self.reading_text is not None
-            and self.source_lang == "ja"
-            and (self.show_romaji or self.show_hiragana)
-        ):
-            try:
-                reading = self.translation_worker.engine.get_japanese_reading(
-                    original, romaji=self.show_romaji, hiragana=self.show_hiragana
-                )
-                if reading:
-                    self.reading_text.setPlainText(reading)
-                else:
-                    self.reading_text.setPlainText("(No Japanese text found)")
-            except Exception as e:
-                logger.error(f"Failed to generate reading: {e}")
-                self.reading_text.setPlainText("(Reading generation failed)")
+        with _batch_updates(self.original_text, self.translation_text):
+            # In manual mode, preserve the user's input text instead of replacing it
+            if not self.is_manual_mode:
+                # Now show both original and translated text
+                self.original_text.setPlainText(original)
+            # Always update the translation
+            self.translation_text.setPlainText(translated)
 
         status = "Cached" if cached else "Translated"
         self.status_label.setText(status)
@@ -788,7 +890,13 @@ class FloatingTranslator(QMainWindow):
         # Don't automatically update clipboard to avoid loops
         # User can manually copy using the Copy button
         cache_status = "[CACHED]" if cached else "[NEW]"
-        logger.info(f"\n🔄 TRANSLATION {cache_status}:\n{translated}\n" + "=" * 60)
+        logger.info(_TRANSLATION_LOG, cache_status, translated)
+
+    @pyqtSlot(str)
+    def on_reading_ready(self, reading: str) -> None:
+        """Show the Japanese reading generated by the worker."""
+        if self.reading_enabled and self.reading_text is not None:
+            self.reading_text.setPlainText(reading)
 
     @pyqtSlot(str)
     def on_translation_error(self, error):
@@ -805,6 +913,9 @@ class FloatingTranslator(QMainWindow):
     @pyqtSlot()
     def open_settings(self):
         """Open the settings dialog."""
+        # Only built on demand, so keep it out of the startup imports
+        from clip_translate.settings_dialog import SettingsDialog
+
         settings_dialog = SettingsDialog(self.config, self)
         settings_dialog.engine_changed.connect(self.on_engine_changed)
         settings_dialog.exec()
@@ -814,18 +925,11 @@ class FloatingTranslator(QMainWindow):
         """Handle engine change from settings dialog."""
         logger.info(f"Engine changed to: {new_engine}")
 
-        # Update the translation worker's engine
-        self.translation_worker.engine = TranslationEngine(self.config)
-
-        # Setup Japanese converter if needed
-        if self.source_lang == "ja" and (self.show_romaji or self.show_hiragana):
-            self.translation_worker.engine.setup_japanese_converter()
+        # Swap the backend in place, keeping caches and the converter
+        self.translation_worker.engine.reload_backend()
 
         # Clear existing translations to force re-translation with new engine
-        self.original_text.clear()
-        self.translation_text.clear()
-        if self.reading_text:
-            self.reading_text.clear()
+        self.clear_text_areas()
 
         # Update status to show new engine
         if self.is_monitoring:
@@ -848,11 +952,17 @@ class FloatingTranslator(QMainWindow):
 
     def mouseMoveEvent(self, event):
         """Handle mouse move for dragging."""
-        if event.buttons() == Qt.MouseButton.LeftButton and hasattr(
-            self, "drag_position"
+        if (
+            event.buttons() == Qt.MouseButton.LeftButton
+            and self.drag_position is not None
         ):
             self.move(event.globalPosition().toPoint() - self.drag_position)
 
+    def mouseReleaseEvent(self, event: QMouseEvent | None) -> None:
+        """Handle mouse release to end dragging."""
+        if event is not None and event.button() == Qt.MouseButton.LeftButton:
+            self.drag_position = None
+
     def closeEvent(self, event):
         """Handle window close event - clean shutdown."""
         logger.info("Closing application...")
@@ -861,18 +971,11 @@ class FloatingTranslator(QMainWindow):
         # Stop clipboard monitoring
         self.is_monitoring = False
         self.clipboard_timer.stop()
+        self.debounce_timer.stop()
+        self.clipboard.dataChanged.disconnect(self.check_clipboard)
 
-        # Stop and clean up translation worker
-        if self.translation_worker.isRunning():
-            self.translation_worker.terminate()
-            self.translation_worker.wait(1000)  # Wait max 1 second
-
-        # Close event loop if exists
-        if hasattr(self.translation_worker, "_loop") and self.translation_worker._loop:
-            try:
-                self.translation_worker._loop.close()
-            except:
-                pass
+        # Stop the translation worker's event loop
+        self.translation_worker.stop()
 
         # Accept the close event
         event.accept()
@@ -885,6 +988,7 @@ def main():
     """Main entry point for GUI."""
     import argparse
     import signal
+    import socket
 
     # Parse command line arguments
     parser = argparse.ArgumentParser(description="Clip Translate GUI")
@@ -906,6 +1010,12 @@ def main():
         action="store_true",
         help="Show hiragana reading for Japanese text",
     )
+    parser.add_argument(
+        "--no-verify-lang",
+        dest="verify_lang",
+        action="store_false",
+        help="Show translations without checking the source language first",
+    )
 
     # Only parse known args to avoid issues with Qt args
     args, remaining = parser.parse_known_args()
@@ -916,6 +1026,7 @@ def main():
 
     # Set application style
     app.setStyle("Fusion")
+    app.setStyleSheet(_STYLESHEET)
 
     # Create main window
     window = FloatingTranslator(
@@ -923,6 +1034,7 @@ def main():
         target_lang=args.target,
         show_romaji=args.romaji,
         show_hiragana=args.hiragana,
+        verify_lang=args.verify_lang,
     )
 
     # Setup signal handler for clean exit on Ctrl+C
@@ -932,10 +1044,16 @@ def main():
 
     signal.signal(signal.SIGINT, signal_handler)
 
-    # Make app handle Ctrl+C properly
-    timer = QTimer()
-    timer.start(500)
-    timer.timeout.connect(lambda: None)  # Let Python handle signals
+    # Python only runs signal handlers once Qt calls back into it, so have
+    # the interpreter write to a socket that wakes the event loop
+    wakeup_read, wakeup_write = socket.socketpair()
+    wakeup_read.setblocking(False)
+    wakeup_write.setblocking(False)
+    signal.set_wakeup_fd(wakeup_write.fileno())
+    notifier = QSocketNotifier(
+        sip.voidptr(wakeup_read.fileno()), QSocketNotifier.Type.Read
+    )
+    notifier.activated.connect(lambda: wakeup_read.recv(64))
 
     window.show()
 
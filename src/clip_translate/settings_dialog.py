@@ -1,9 +1,12 @@
 """Settings dialog for translation engine configuration."""
 
 import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any
 
 from loguru import logger
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, pyqtSlot
+from PyQt6.QtCore import QObject, Qt, pyqtSignal, pyqtSlot
 from PyQt6.QtWidgets import (
     QComboBox,
     QDialog,
@@ -22,20 +25,205 @@ from PyQt6.QtWidgets import (
 )
 
 from clip_translate.config import Config
-from clip_translate.engines import get_backend
-
-
-class ConnectionTestWorker(QThread):
-    """Worker thread for testing engine connections."""
+from clip_translate.engines import close_shared_clients, get_backend
+
+# Dialog style, shared by every settings dialog
+_STYLESHEET = """
+QDialog {
+    background-color: #2b2b2b;
+    color: #ffffff;
+}
+
+QGroupBox {
+    color: #ffffff;
+    font-weight: bold;
+    border: 1px solid rgba(80, 80, 80, 150);
+    border-radius: 6px;
+    margin-top: 6px;
+    padding-top: 10px;
+}
+
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px 0 5px;
+}
+
+QTabWidget::pane {
+    border: 1px solid rgba(70, 70, 70, 150);
+    background-color: rgba(45, 45, 45, 200);
+}
+
+QTabWidget::tab-bar {
+    left: 5px;
+}
+
+QTabBar::tab {
+    background-color: rgba(60, 60, 60, 200);
+    color: #ffffff;
+    padding: 8px 12px;
+    margin-right: 2px;
+    border-top-left-radius: 4px;
+    border-top-right-radius: 4px;
+}
+
+QTabBar::tab:selected {
+    background-color: rgba(70, 130, 180, 200);
+}
+
+QTabBar::tab:hover {
+    background-color: rgba(80, 80, 80, 200);
+}
+
+QComboBox {
+    background-color: rgba(50, 50, 50, 200);
+    color: #ffffff;
+    border: 1px solid rgba(70, 70, 70, 150);
+    border-radius: 4px;
+    padding: 4px;
+    min-width: 150px;
+}
+
+QComboBox::drop-down {
+    border: none;
+}
+
+QComboBox::down-arrow {
+    image: none;
+    border-left: 5px solid transparent;
+    border-right: 5px solid transparent;
+    border-top: 5px solid #ffffff;
+    margin-right: 5px;
+}
+
+QComboBox QAbstractItemView {
+    background-color: rgba(255, 248, 220, 250);
+    color: #000000;
+    selection-background-color: rgba(70, 130, 180, 200);
+    selection-color: #ffffff;
+    border: 1px solid rgba(70, 70, 70, 150);
+    border-radius: 4px;
+    padding: 2px;
+}
+
+QComboBox QAbstractItemView::item {
+    color: #000000;
+    background-color: transparent;
+    padding: 4px;
+}
+
+QComboBox QAbstractItemView::item:selected {
+    background-color: rgba(70, 130, 180, 200);
+    color: #ffffff;
+}
+
+QLineEdit {
+    background-color: rgba(45, 45, 45, 200);
+    color: #ffffff;
+    border: 1px solid rgba(70, 70, 70, 150);
+    border-radius: 4px;
+    padding: 6px;
+}
+
+QLineEdit:focus {
+    border-color: rgba(70, 130, 180, 200);
+}
+
+QTextEdit {
+    background-color: rgba(45, 45, 45, 200);
+    color: #ffffff;
+    border: 1px solid rgba(70, 70, 70, 150);
+    border-radius: 4px;
+    padding: 5px;
+}
+
+QTextEdit[result="success"] {
+    color: #90EE90;
+}
+
+QTextEdit[result="failure"] {
+    color: #FFB6C1;
+}
+
+QPushButton {
+    background-color: rgba(70, 130, 180, 200);
+    color: #ffffff;
+    border: none;
+    border-radius: 4px;
+    padding: 8px 16px;
+    font-weight: bold;
+}
+
+QPushButton:hover {
+    background-color: rgba(100, 149, 237, 200);
+}
+
+QPushButton:pressed {
+    background-color: rgba(65, 105, 225, 200);
+}
+
+QPushButton:disabled {
+    background-color: rgba(60, 60, 60, 200);
+    color: #888888;
+}
+
+QProgressBar {
+    border: 1px solid rgba(70, 70, 70, 150);
+    border-radius: 4px;
+    background-color: rgba(45, 45, 45, 200);
+    color: #ffffff;
+    text-align: center;
+}
+
+QProgressBar::chunk {
+    background-color: rgba(70, 130, 180, 200);
+    border-radius: 3px;
+}
+
+QLabel {
+    color: #ffffff;
+}
+"""
+
+
+async def _prewarm_backend(engine: str, engine_config: dict[str, Any]) -> None:
+    """Create a backend on the test loop so its SDK and client are ready."""
+    # Built on the loop, the backend's client is shared with later tests
+    try:
+        get_backend(engine, **engine_config).validate_config()
+    except Exception as e:
+        logger.debug(f"Failed to prewarm {engine}: {e}")
+
+
+class ConnectionTestWorker(QObject):
+    """Tests an engine connection on an event loop running in another thread."""
 
     test_completed = pyqtSignal(str, bool, str)  # engine, success, message
+    finished = pyqtSignal()
+
+    # Seconds to wait for the test translation
+    TIMEOUT = 30.0
 
     def __init__(self, engine: str, config: Config):
         super().__init__()
         self.engine = engine
         self.config = config
+        self._future: Future[None] | None = None
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Schedule the test on the loop."""
+        self._future = asyncio.run_coroutine_threadsafe(self.run_test(), loop)
 
-    def run(self):
+    def is_running(self) -> bool:
+        """Check whether the test is still in progress."""
+        return self._future is not None and not self._future.done()
+
+    def cancel(self) -> None:
+        """Cancel the test if it is still in progress."""
+        if self._future is not None:
+            self._future.cancel()
+
+    async def run_test(self) -> None:
         """Test the connection to the engine."""
         try:
             logger.info(f"Testing connection for {self.engine}")
@@ -65,20 +253,26 @@ class ConnectionTestWorker(QThread):
                 return
 
             # Try a simple translation test for other engines
-            loop = None
             try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-
                 logger.info(f"Starting translation test for {self.engine}")
 
-                # Add timeout to prevent hanging
-                result = loop.run_until_complete(
-                    asyncio.wait_for(
-                        backend.translate("Hello", "en", "es"),
-                        timeout=30.0,  # 30 second timeout
+                # Report a timeout straight away instead of waiting for the
+                # request to finish cancelling
+                task = asyncio.ensure_future(backend.translate("Hello", "en", "es"))
+                try:
+                    done, _ = await asyncio.wait({task}, timeout=self.TIMEOUT)
+                finally:
+                    if not task.done():
+                        task.cancel()
+                if not done:
+                    logger.warning(f"Translation test timed out for {self.engine}")
+                    self.test_completed.emit(
+                        self.engine,
+                        False,
+                        f"Translation test timed out after {self.TIMEOUT:.0f} seconds",
                     )
-                )
+                    return
+                result = task.result()
 
                 if result and result.strip():
                     logger.info(f"Test successful for {self.engine}: {result}")
@@ -98,38 +292,26 @@ class ConnectionTestWorker(QThread):
                 self.test_completed.emit(
                     self.engine, False, f"Translation test failed: {str(e)}"
                 )
-            finally:
-                if loop:
-                    try:
-                        loop.close()
-                    except:
-                        pass
 
         except Exception as e:
             logger.error(f"Connection test error for {self.engine}: {e}")
             self.test_completed.emit(self.engine, False, f"Connection failed: {str(e)}")
+        finally:
+            self.finished.emit()
 
 
 class EngineConfigWidget(QWidget):
     """Widget for configuring a specific engine."""
 
-    def __init__(self, engine: str, config: Config):
+    def __init__(self, engine: str, config: Config, loop: asyncio.AbstractEventLoop):
         super().__init__()
         self.engine = engine
         self.config = config
-        self.test_worker = None
+        self.loop = loop
+        self.test_worker: ConnectionTestWorker | None = None
         self.init_ui()
         self.load_config()
 
-    def __del__(self):
-        """Cleanup when widget is destroyed."""
-        try:
-            if self.test_worker and self.test_worker.isRunning():
-                self.test_worker.terminate()
-                self.test_worker.wait(1000)
-        except:
-            pass
-
     def init_ui(self):
         """Initialize the UI for this engine."""
         layout = QVBoxLayout()
@@ -232,7 +414,7 @@ class EngineConfigWidget(QWidget):
                 if index >= 0:
                     self.model_combo.setCurrentIndex(index)
 
-    def save_config(self):
+    def save_config(self) -> None:
         """Save configuration for this engine."""
         if self.api_key_input:
             api_key = self.api_key_input.text().strip()
@@ -249,10 +431,9 @@ class EngineConfigWidget(QWidget):
             self.save_config()
 
             # Clean up any existing worker
-            if self.test_worker and self.test_worker.isRunning():
-                logger.warning("Previous test still running, terminating...")
-                self.test_worker.terminate()
-                self.test_worker.wait(1000)
+            if self.test_worker and self.test_worker.is_running():
+                logger.warning("Previous test still running, cancelling...")
+                self.cancel_test()
 
             # Start test
             self.test_button.setEnabled(False)
@@ -261,19 +442,18 @@ class EngineConfigWidget(QWidget):
             self.test_result.clear()
             self.test_result.setPlainText("Testing connection...")
 
-            # Create and start worker thread
+            # Run the test on the dialog's event loop
             logger.info(f"Starting connection test for {self.engine}")
             self.test_worker = ConnectionTestWorker(self.engine, self.config)
             self.test_worker.test_completed.connect(self.on_test_completed)
             self.test_worker.finished.connect(self.on_test_finished)
-            self.test_worker.start()
+            self.test_worker.start(self.loop)
 
         except Exception as e:
             logger.error(f"Failed to start connection test: {e}")
             self.test_button.setEnabled(True)
             self.progress_bar.setVisible(False)
-            self.test_result.setStyleSheet("color: #FFB6C1;")  # Light red
-            self.test_result.setPlainText(f"✗ Test failed to start: {str(e)}")
+            self.show_result(False, f"Test failed to start: {str(e)}")
 
     @pyqtSlot(str, bool, str)
     def on_test_completed(self, engine, success, message):
@@ -285,23 +465,48 @@ class EngineConfigWidget(QWidget):
         self.test_button.setEnabled(True)
         self.progress_bar.setVisible(False)
 
-        if success:
-            self.test_result.setStyleSheet("color: #90EE90;")  # Light green
-            self.test_result.setPlainText(f"✓ {message}")
-        else:
-            self.test_result.setStyleSheet("color: #FFB6C1;")  # Light red
-            self.test_result.setPlainText(f"✗ {message}")
+        self.show_result(success, message)
 
-    @pyqtSlot()
-    def on_test_finished(self):
-        """Handle test thread finished."""
-        logger.info(f"Test thread finished for {self.engine}")
+    def show_result(self, success: bool, message: str) -> None:
+        """Show a test result, colored by outcome."""
+        # Switch between the dialog's result rules rather than giving the
+        # widget its own stylesheet to parse
+        self.test_result.setProperty("result", "success" if success else "failure")
+        style = self.test_result.style()
+        if style is not None:
+            style.unpolish(self.test_result)
+            style.polish(self.test_result)
+        self.test_result.setPlainText(f"{'✓' if success else '✗'} {message}")
 
-        # Clean up worker
-        if self.test_worker:
-            self.test_worker.deleteLater()
+    @pyqtSlot()
+    def on_test_finished(self) -> None:
+        """Handle test finished."""
+        logger.info(f"Test finished for {self.engine}")
+
+        # Clean up the worker that finished, which may be a cancelled one
+        # rather than the test now running
+        worker = self.sender()
+        if not isinstance(worker, ConnectionTestWorker):
+            return
+        if worker is self.test_worker:
+            self._disconnect_worker(worker)
+            self.test_worker = None
+        worker.deleteLater()
+
+    def cancel_test(self) -> None:
+        """Cancel the running test and stop listening for its result."""
+        if self.test_worker and self.test_worker.is_running():
+            self.test_worker.cancel()
+            # The test may still be unwinding on the loop thread, so leave
+            # the worker to be freed once the coroutine drops it
+            self._disconnect_worker(self.test_worker)
             self.test_worker = None
 
+    def _disconnect_worker(self, worker: ConnectionTestWorker) -> None:
+        """Disconnect a test worker's signals from this widget."""
+        worker.test_completed.disconnect(self.on_test_completed)
+        worker.finished.disconnect(self.on_test_finished)
+
 
 class SettingsDialog(QDialog):
     """Settings dialog for translation engine configuration."""
@@ -312,7 +517,16 @@ class SettingsDialog(QDialog):
     def __init__(self, config: Config, parent=None):
         super().__init__(parent)
         self.config = config
-        self.engine_widgets = {}
+        self.engine_widgets: dict[str, EngineConfigWidget] = {}
+
+        # Connection tests share one event loop for the dialog's lifetime,
+        # so API clients stay warm between tests
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name="connection-test", daemon=True
+        )
+        self._thread.start()
+
         self.init_ui()
         self.load_settings()
 
@@ -323,154 +537,7 @@ class SettingsDialog(QDialog):
         self.setModal(True)
 
         # Apply dark theme
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            
-            QGroupBox {
-                color: #ffffff;
-                font-weight: bold;
-                border: 1px solid rgba(80, 80, 80, 150);
-                border-radius: 6px;
-                margin-top: 6px;
-                padding-top: 10px;
-            }
-            
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-            
-            QTabWidget::pane {
-                border: 1px solid rgba(70, 70, 70, 150);
-                background-color: rgba(45, 45, 45, 200);
-            }
-            
-            QTabWidget::tab-bar {
-                left: 5px;
-            }
-            
-            QTabBar::tab {
-                background-color: rgba(60, 60, 60, 200);
-                color: #ffffff;
-                padding: 8px 12px;
-                margin-right: 2px;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-            }
-            
-            QTabBar::tab:selected {
-                background-color: rgba(70, 130, 180, 200);
-            }
-            
-            QTabBar::tab:hover {
-                background-color: rgba(80, 80, 80, 200);
-            }
-            
-            QComboBox {
-                background-color: rgba(50, 50, 50, 200);
-                color: #ffffff;
-                border: 1px solid rgba(70, 70, 70, 150);
-                border-radius: 4px;
-                padding: 4px;
-                min-width: 150px;
-            }
-            
-            QComboBox::drop-down {
-                border: none;
-            }
-            
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid #ffffff;
-                margin-right: 5px;
-            }
-            
-            QComboBox QAbstractItemView {
-                background-color: rgba(255, 248, 220, 250);
-                color: #000000;
-                selection-background-color: rgba(70, 130, 180, 200);
-                selection-color: #ffffff;
-                border: 1px solid rgba(70, 70, 70, 150);
-                border-radius: 4px;
-                padding: 2px;
-            }
-            
-            QComboBox QAbstractItemView::item {
-                color: #000000;
-                background-color: transparent;
-                padding: 4px;
-            }
-            
-            QComboBox QAbstractItemView::item:selected {
-                background-color: rgba(70, 130, 180, 200);
-                color: #ffffff;
-            }
-            
-            QLineEdit {
-                background-color: rgba(45, 45, 45, 200);
-                color: #ffffff;
-                border: 1px solid rgba(70, 70, 70, 150);
-                border-radius: 4px;
-                padding: 6px;
-            }
-            
-            QLineEdit:focus {
-                border-color: rgba(70, 130, 180, 200);
-            }
-            
-            QTextEdit {
-                background-color: rgba(45, 45, 45, 200);
-                color: #ffffff;
-                border: 1px solid rgba(70, 70, 70, 150);
-                border-radius: 4px;
-                padding: 5px;
-            }
-            
-            QPushButton {
-                background-color: rgba(70, 130, 180, 200);
-                color: #ffffff;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            
-            QPushButton:hover {
-                background-color: rgba(100, 149, 237, 200);
-            }
-            
-            QPushButton:pressed {
-                background-color: rgba(65, 105, 225, 200);
-            }
-            
-            QPushButton:disabled {
-                background-color: rgba(60, 60, 60, 200);
-                color: #888888;
-            }
-            
-            QProgressBar {
-                border: 1px solid rgba(70, 70, 70, 150);
-                border-radius: 4px;
-                background-color: rgba(45, 45, 45, 200);
-                color: #ffffff;
-                text-align: center;
-            }
-            
-            QProgressBar::chunk {
-                background-color: rgba(70, 130, 180, 200);
-                border-radius: 3px;
-            }
-            
-            QLabel {
-                color: #ffffff;
-            }
-        """)
+        self.setStyleSheet(_STYLESHEET)
 
         layout = QVBoxLayout()
 
@@ -500,10 +567,11 @@ class SettingsDialog(QDialog):
         self.tab_widget = QTabWidget()
 
         for engine in engines:
-            widget = EngineConfigWidget(engine, self.config)
+            widget = EngineConfigWidget(engine, self.config, self.loop)
             self.engine_widgets[engine] = widget
             self.tab_widget.addTab(widget, engine.title())
 
+        self.tab_widget.currentChanged.connect(self.prewarm_engine)
         layout.addWidget(self.tab_widget)
 
         # Dialog buttons
@@ -525,18 +593,52 @@ class SettingsDialog(QDialog):
     def closeEvent(self, event):
         """Handle dialog close event."""
         try:
-            # Stop any running tests
-            for widget in self.engine_widgets.values():
-                if widget.test_worker and widget.test_worker.isRunning():
-                    logger.info(f"Terminating test worker for {widget.engine}")
-                    widget.test_worker.terminate()
-                    widget.test_worker.wait(1000)
-
+            self.stop_tests()
             event.accept()
         except Exception as e:
             logger.error(f"Error closing settings dialog: {e}")
             event.accept()
 
+    def done(self, result: int) -> None:
+        """Stop connection tests when the dialog is accepted or rejected."""
+        self.stop_tests()
+        super().done(result)
+
+    def stop_tests(self) -> None:
+        """Cancel running connection tests and stop their event loop."""
+        if self.loop.is_closed():
+            return
+        self.tab_widget.currentChanged.disconnect(self.prewarm_engine)
+        for widget in self.engine_widgets.values():
+            if widget.test_worker and widget.test_worker.is_running():
+                logger.info(f"Cancelling test for {widget.engine}")
+                widget.cancel_test()
+
+        # Close pooled connections on the loop that owns them
+        try:
+            asyncio.run_coroutine_threadsafe(close_shared_clients(), self.loop).result(
+                timeout=1
+            )
+        except Exception as e:
+            logger.debug(f"Failed to close HTTP clients: {e}")
+
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(1)
+        if not self._thread.is_alive():
+            self.loop.close()
+
+    @pyqtSlot(int)
+    def prewarm_engine(self, index: int) -> None:
+        """Build the backend of the selected engine ahead of a connection test."""
+        widget = self.tab_widget.widget(index)
+        if not isinstance(widget, EngineConfigWidget) or self.loop.is_closed():
+            return
+        engine = widget.engine
+        engine_config = dict(self.config.get_engine_config(engine))
+        asyncio.run_coroutine_threadsafe(
+            _prewarm_backend(engine, engine_config), self.loop
+        )
+
     def close_dialog(self):
         """Close the dialog safely."""
         self.close()
@@ -0,0 +1,90 @@
+"""Tests for translation caches."""
+
+import time
+from pathlib import Path
+
+from clip_translate.cache import LRUCache, TranslationCache
+
+
+class TestLRUCache:
+    """Test the in-memory LRU cache."""
+
+    def test_get_missing_returns_default(self) -> None:
+        """Test that missing keys return the default."""
+        cache = LRUCache(maxsize=2)
+        assert cache.get("missing") is None
+        assert cache.get("missing", "default") == "default"
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test that the oldest untouched entry is evicted first."""
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert len(cache) == 2
+
+
+class TestTranslationCache:
+    """Test the persistent SQLite cache."""
+
+    def test_round_trip_across_instances(self, tmp_path: Path) -> None:
+        """Test that translations survive reopening the database."""
+        path = tmp_path / "cache.db"
+        key = TranslationCache.make_key("google", "ja", "en", "こんにちは")
+
+        cache = TranslationCache(path)
+        cache.set(key, "Hello")
+        cache.close()
+
+        reopened = TranslationCache(path)
+        assert reopened.get(key) == "Hello"
+        reopened.close()
+
+    def test_key_depends_on_language_pair(self) -> None:
+        """Test that the same text under different languages gets different keys."""
+        assert TranslationCache.make_key(
+            "google", "ja", "en", "text"
+        ) != TranslationCache.make_key("google", "ja", "fr", "text")
+
+    def test_expired_entries_are_purged(self, tmp_path: Path) -> None:
+        """Test that entries older than the TTL are ignored and purged."""
+        cache = TranslationCache(tmp_path / "cache.db", ttl_seconds=60)
+        key = TranslationCache.make_key("google", "ja", "en", "text")
+        cache.set(key, "stale")
+        cache._conn.execute("UPDATE translations SET ts = ?", (int(time.time()) - 120,))
+
+        assert cache.get(key) is None
+        assert cache.purge_expired() == 1
+        cache.close()
+
+    def test_excess_entries_are_pruned_oldest_first(self, tmp_path: Path) -> None:
+        """Test that the cache keeps only the newest max_entries translations."""
+        cache = TranslationCache(tmp_path / "cache.db", max_entries=2)
+        keys = [TranslationCache.make_key("google", "ja", "en", t) for t in "abc"]
+        for age, key in zip((30, 20, 10), keys, strict=True):
+            cache.set(key, "value")
+            cache._conn.execute(
+                "UPDATE translations SET ts = ? WHERE hash = ?",
+                (int(time.time()) - age, key),
+            )
+
+        assert cache.purge_expired() == 1
+        assert cache.get(keys[0]) is None
+        assert cache.get(keys[2]) == "value"
+        cache.close()
+
+    def test_shared_reuses_open_cache(self, tmp_path: Path) -> None:
+        """Test that shared caches are reused per path until closed."""
+        path = tmp_path / "cache.db"
+        cache = TranslationCache.shared(path)
+        assert TranslationCache.shared(path) is cache
+
+        cache.close()
+        reopened = TranslationCache.shared(path)
+        assert reopened is not cache
+        reopened.close()
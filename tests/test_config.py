@@ -0,0 +1,38 @@
+"""Tests for configuration management."""
+
+from pathlib import Path
+
+from clip_translate.config import Config
+
+
+class TestConfigGet:
+    """Test dotted-key configuration lookups."""
+
+    def test_nested_and_missing_keys(self, tmp_path: Path) -> None:
+        """Test that dotted keys resolve and missing keys return the default."""
+        config = Config(tmp_path / "config.json")
+        assert config.get("openai.model") == "gpt-4o-mini"
+        assert config.get("cache_enabled") is True
+        assert config.get("openai.missing", "default") == "default"
+        assert config.get("engine.api_key") is None
+
+    def test_lookups_follow_updates(self, tmp_path: Path) -> None:
+        """Test that set, set_engine and set_api_key are visible to get."""
+        config = Config(tmp_path / "config.json")
+        config.set("openai.model", "gpt-4o")
+        config.set_engine("deepl")
+        config.set_api_key("deepl", "secret")
+
+        assert config.get("openai.model") == "gpt-4o"
+        assert config.get("engine") == "deepl"
+        assert config.get("deepl.api_key") == "secret"
+
+    def test_round_trip_does_not_touch_defaults(self, tmp_path: Path) -> None:
+        """Test that saved values reload without mutating the defaults."""
+        path = tmp_path / "config.json"
+        config = Config(path)
+        config.set_api_key("openai", "secret")
+        assert config.save_config()
+
+        assert Config(path).get("openai.api_key") == "secret"
+        assert Config.DEFAULT_CONFIG["openai"]["api_key"] == ""
@@ -1,8 +1,18 @@
 """Tests for core functionality."""
 
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
 import pytest
 
-from clip_translate.core import Config
+from clip_translate.core import (
+    BatchingTranslator,
+    Config,
+    TranslationEngine,
+    _guess_language,
+    _remove_blank_lines,
+)
 
 
 class TestConfig:
@@ -24,3 +34,289 @@ class TestConfig:
         """Test that extra fields are rejected."""
         with pytest.raises(ValueError):
             Config(invalid_field="value")
+
+
+class TestRemoveBlankLines:
+    """Test blank line removal."""
+
+    def test_drops_blank_and_whitespace_lines(self) -> None:
+        """Test that empty and whitespace-only lines are removed."""
+        text = "\n  first\n\n \t\nsecond  \n\n"
+        assert _remove_blank_lines(text) == "first\nsecond"
+
+    def test_keeps_indentation(self) -> None:
+        """Test that leading whitespace on kept lines is preserved."""
+        assert _remove_blank_lines("a\n \n  b") == "a\n  b"
+
+
+class TestGuessLanguage:
+    """Test local language detection from the script."""
+
+    def test_unambiguous_scripts(self) -> None:
+        """Test that kana, hangul and plain English are recognized."""
+        assert _guess_language("漢字とかな") == "ja"
+        assert _guess_language("안녕하세요") == "ko"
+        assert _guess_language("This is the one") == "en"
+
+    def test_ambiguous_text_returns_none(self) -> None:
+        """Test that kanji-only and other Latin text is left to the engine."""
+        assert _guess_language("漢字") is None
+        assert _guess_language("Bonjour le monde") is None
+
+
+class TestTranslateText:
+    """Test translation short-circuits that skip the backend."""
+
+    @pytest.fixture
+    def engine(self, tmp_path: Path) -> TranslationEngine:
+        """Create an engine whose config and cache live in a temp dir."""
+        return TranslationEngine(Config(tmp_path / "config.json"))
+
+    def test_blank_text_is_not_translated(self, engine: TranslationEngine) -> None:
+        """Test that whitespace-only text returns empty without a request."""
+        assert asyncio.run(engine.translate_text(" \n\n ", "ja", "en")) == (
+            "",
+            "",
+            False,
+        )
+
+    def test_same_language_returns_original(self, engine: TranslationEngine) -> None:
+        """Test that translating into the source language is an identity."""
+        result = asyncio.run(engine.translate_text("hello\n\nworld", "en", "en"))
+        assert result == ("hello\nworld", "hello\nworld", False)
+        assert len(engine.cache) == 0
+
+    def test_stream_yields_partial_translations(
+        self, engine: TranslationEngine
+    ) -> None:
+        """Test that streamed pieces accumulate and the result is cached."""
+
+        async def translate_stream(text, source, target):
+            for piece in ("Hel", "lo", "\n\nworld"):
+                yield piece
+
+        engine._backend = SimpleNamespace(translate_stream=translate_stream)
+        engine._engine_name = "test"
+
+        async def collect(text):
+            return [
+                result
+                async for result in engine.translate_text_stream(text, "ja", "en")
+            ]
+
+        assert [t for t, _, _ in asyncio.run(collect("こんにちは"))] == [
+            "Hel",
+            "Hello",
+            "Hello\nworld",
+        ]
+        assert asyncio.run(collect("こんにちは")) == [
+            ("Hello\nworld", "こんにちは", True)
+        ]
+
+    def test_translate_many_bounds_concurrency(self, engine: TranslationEngine) -> None:
+        """Test that translate_many limits in-flight requests and dedupes texts."""
+        active = peak = calls = 0
+
+        async def translate(text, source, target):
+            nonlocal active, peak, calls
+            active += 1
+            calls += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return text.upper()
+
+        engine._backend = SimpleNamespace(translate=translate)
+        engine._engine_name = "test"
+
+        texts = ["a", "b", "c", "a", "d"]
+        results = asyncio.run(
+            engine.translate_many(texts, "ja", "en", max_concurrency=2)
+        )
+
+        assert [translated for translated, _, _ in results] == ["A", "B", "C", "A", "D"]
+        assert calls == 4
+        assert peak == 2
+
+    def test_repeated_text_skips_detection(self, engine: TranslationEngine) -> None:
+        """Test that a recopied text is served without any backend request."""
+        calls = 0
+
+        async def detect_and_translate(text, source, target):
+            nonlocal calls
+            calls += 1
+            return "ja", "Hello"
+
+        async def detect_language(text):
+            raise AssertionError("detection should be cached")
+
+        engine._backend = SimpleNamespace(
+            detect_and_translate=detect_and_translate, detect_language=detect_language
+        )
+        engine._engine_name = "test"
+
+        assert asyncio.run(engine.detect_and_translate("こんにちは", "ja", "en")) == (
+            "ja",
+            "Hello",
+            "こんにちは",
+            False,
+        )
+        assert asyncio.run(engine.detect_and_translate("こんにちは", "ja", "en")) == (
+            "ja",
+            "Hello",
+            "こんにちは",
+            True,
+        )
+        assert calls == 1
+
+    def test_detection_survives_restart(self, engine: TranslationEngine) -> None:
+        """Test that detected languages are read back from the persistent cache."""
+
+        async def detect_language(text):
+            return "ja"
+
+        engine._backend = SimpleNamespace(detect_language=detect_language)
+        engine._engine_name = "test"
+        assert asyncio.run(engine.detect_language("こんにちは")) == "ja"
+
+        async def fail(text):
+            raise AssertionError("detection should be cached on disk")
+
+        restarted = TranslationEngine(engine.config)
+        restarted._backend = SimpleNamespace(detect_language=fail)
+        restarted._engine_name = "test"
+        assert asyncio.run(restarted.detect_language("こんにちは")) == "ja"
+
+    def test_reload_backend_uses_configured_engine(
+        self, engine: TranslationEngine
+    ) -> None:
+        """Test that reloading picks up an engine change and clears memory caches."""
+        engine.cache.set(b"key", ("Hello", "こんにちは"))
+        assert engine.engine_name == "google"
+
+        engine.config.set_engine("deepl")
+        engine.config.set_api_key("deepl", "secret")
+        engine.reload_backend()
+
+        assert len(engine.cache) == 0
+        assert engine.engine_name == "deepl"
+
+    def test_bulk_batch_uses_backend_bulk_api(self, engine: TranslationEngine) -> None:
+        """Test that bulk batches go to translate_bulk where the backend has one."""
+        calls = []
+
+        async def translate_bulk(texts, source, target):
+            calls.append(("bulk", texts))
+            return [text.upper() for text in texts]
+
+        async def translate_batch(texts, source, target):
+            calls.append(("batch", texts))
+            return [text.upper() for text in texts]
+
+        engine._backend = SimpleNamespace(
+            translate_bulk=translate_bulk, translate_batch=translate_batch
+        )
+        engine._engine_name = "test"
+
+        results = asyncio.run(engine.translate_many(["a", "b"], "ja", "en", bulk=True))
+        assert [translated for translated, _, _ in results] == ["A", "B"]
+
+        engine._backend = SimpleNamespace(translate_batch=translate_batch)
+        asyncio.run(engine.translate_batch(["c"], "ja", "en", bulk=True))
+        assert calls == [("bulk", ["a", "b"]), ("batch", ["c"])]
+
+
+class TestBatchingTranslator:
+    """Test coalescing of concurrent requests into batches."""
+
+    @pytest.fixture
+    def engine(self, tmp_path: Path) -> TranslationEngine:
+        """Create an engine with a stub backend that records its batches."""
+        engine = TranslationEngine(Config(tmp_path / "config.json"))
+        engine.batches = []
+
+        async def translate_batch(texts, source, target):
+            engine.batches.append((texts, source, target))
+            return [text.upper() for text in texts]
+
+        engine._backend = SimpleNamespace(translate_batch=translate_batch)
+        engine._engine_name = "test"
+        return engine
+
+    @staticmethod
+    def run(engine: TranslationEngine, *requests: tuple[str, str, str]) -> list:
+        """Send requests concurrently through one batching translator."""
+
+        async def main():
+            batcher = BatchingTranslator(engine)
+            try:
+                return await asyncio.wait_for(
+                    asyncio.gather(
+                        *(batcher.translate(*request) for request in requests),
+                        return_exceptions=True,
+                    ),
+                    timeout=1,
+                )
+            finally:
+                await batcher.close()
+
+        return asyncio.run(main())
+
+    def test_coalesces_per_language_pair(self, engine: TranslationEngine) -> None:
+        """Test that concurrent requests become one batch per language pair."""
+        results = self.run(
+            engine, ("a", "ja", "en"), ("b", "ko", "en"), ("c", "ja", "en")
+        )
+
+        assert [translated for translated, _, _ in results] == ["A", "B", "C"]
+        assert engine.batches == [(["a", "c"], "ja", "en"), (["b"], "ko", "en")]
+
+    def test_duplicates_are_sent_once(self, engine: TranslationEngine) -> None:
+        """Test that repeated texts in a batch are translated once."""
+        results = self.run(engine, ("a", "ja", "en"), ("a", "ja", "en"))
+
+        assert results == [("A", "a", False), ("A", "a", False)]
+        assert engine.batches == [(["a"], "ja", "en")]
+
+    def test_cached_texts_skip_backend(self, engine: TranslationEngine) -> None:
+        """Test that cached texts are answered without a backend call."""
+        self.run(engine, ("a", "ja", "en"))
+        results = self.run(engine, ("a", "ja", "en"), ("b", "ja", "en"))
+
+        assert results == [("A", "a", True), ("B", "b", False)]
+        assert engine.batches == [(["a"], "ja", "en"), (["b"], "ja", "en")]
+
+    def test_backend_error_reaches_every_caller(
+        self, engine: TranslationEngine
+    ) -> None:
+        """Test that a failed batch raises in each waiting caller."""
+
+        async def translate_batch(texts, source, target):
+            raise RuntimeError("backend down")
+
+        engine._backend = SimpleNamespace(translate_batch=translate_batch)
+        results = self.run(engine, ("a", "ja", "en"), ("b", "ja", "en"))
+
+        assert [type(result) for result in results] == [RuntimeError, RuntimeError]
+
+    def test_close_fails_pending_requests(self, engine: TranslationEngine) -> None:
+        """Test that closing fails both in-flight and still-queued requests."""
+
+        async def translate_batch(texts, source, target):
+            await asyncio.Event().wait()
+
+        engine._backend = SimpleNamespace(translate_batch=translate_batch)
+
+        async def main():
+            batcher = BatchingTranslator(engine, window=0, max_batch=1)
+            pending = asyncio.gather(
+                batcher.translate("a", "ja", "en"),
+                batcher.translate("b", "ja", "en"),
+                return_exceptions=True,
+            )
+            await asyncio.sleep(0.01)
+            await batcher.close()
+            return await asyncio.wait_for(pending, timeout=1)
+
+        results = asyncio.run(main())
+        assert [type(result) for result in results] == [RuntimeError, RuntimeError]
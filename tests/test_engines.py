@@ -0,0 +1,177 @@
+"""Tests for translation backends."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+from clip_translate.engines import (
+    GoogleTranslateBackend,
+    OpenAIBackend,
+    _join_segments,
+    _loop_clients,
+    _parse_detect_translate,
+    _shared_client,
+    _split_segments,
+    _unwrap,
+    _wrap,
+    close_shared_clients,
+)
+
+
+class TestBatchSegments:
+    """Test tagging of texts sent to LLMs as one batch."""
+
+    def test_round_trip_keeps_multiline_texts(self) -> None:
+        """Test that texts containing newlines split back out unchanged."""
+        texts = ["first\nline", "second"]
+        assert _split_segments(_join_segments(texts), 2) == texts
+
+    def test_reply_order_does_not_matter(self) -> None:
+        """Test that translations are matched to their tags, not positions."""
+        reply = "<t1>B</t1>\n<t0>A</t0>"
+        assert _split_segments(reply, 2) == ["A", "B"]
+
+    def test_missing_segment_returns_none(self) -> None:
+        """Test that an incomplete reply is rejected."""
+        assert _split_segments("<t0>A</t0>", 2) is None
+
+
+class TestDetectTranslateReply:
+    """Test parsing of combined detect-and-translate LLM replies."""
+
+    def test_parses_fenced_json(self) -> None:
+        """Test that code fences around the JSON object are ignored."""
+        reply = '```json\n{"lang": "JA", "translation": " Hello "}\n```'
+        assert _parse_detect_translate(reply, {"ja": "Japanese"}) == ("ja", "Hello")
+
+    def test_unknown_language_is_none(self) -> None:
+        """Test that unsupported language codes are reported as None."""
+        reply = '{"lang": "xx", "translation": "Hello"}'
+        assert _parse_detect_translate(reply, {"ja": "Japanese"}) == (None, "Hello")
+
+    def test_malformed_reply_returns_none(self) -> None:
+        """Test that replies without a translation are rejected."""
+        assert _parse_detect_translate("Hello", {}) is None
+        assert _parse_detect_translate('{"lang": "ja"}', {}) is None
+
+
+class TestPromptTags:
+    """Test the tags marking text sent to LLMs for translation."""
+
+    def test_unwrap_strips_echoed_tags(self) -> None:
+        """Test that echoed tags are removed and plain replies are kept."""
+        assert _unwrap(_wrap("Hello")) == "Hello"
+        assert _unwrap(" Hello\n") == "Hello"
+
+
+class TestSharedClients:
+    """Test clients shared by backends on one event loop."""
+
+    def test_clients_are_shared_then_closed(self) -> None:
+        """Test that a loop reuses one client per key until it is closed."""
+
+        class Client:
+            closed = False
+
+            async def __aexit__(self, *exc_info) -> None:
+                self.closed = True
+
+        async def run() -> Client:
+            client = _shared_client(("test",), Client)
+            assert _shared_client(("test",), Client) is client
+            await close_shared_clients()
+            assert asyncio.get_running_loop() not in _loop_clients
+            return client
+
+        assert asyncio.run(run()).closed
+
+
+class TestOpenAIBulk:
+    """Test translation through the OpenAI Batch API."""
+
+    def test_results_keep_order_and_failures_are_retried(self, monkeypatch) -> None:
+        """Test that output is matched by custom_id and failed items retried."""
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        backend = OpenAIBackend()
+        submitted = {}
+
+        def record(custom_id, content=None):
+            if content is None:
+                response = {"status_code": 500, "body": {}}
+            else:
+                message = {"content": _wrap(content)}
+                response = {
+                    "status_code": 200,
+                    "body": {"choices": [{"message": message}]},
+                }
+            return json.dumps({"custom_id": custom_id, "response": response})
+
+        async def create_file(file, purpose):
+            submitted["requests"] = [json.loads(line) for line in file[1].splitlines()]
+            return SimpleNamespace(id="file-in")
+
+        async def content(file_id):
+            assert file_id == "file-out"
+            return SimpleNamespace(
+                text="\n".join([record("2", "C"), record("0", "A"), record("1")])
+            )
+
+        statuses = iter(["in_progress", "completed"])
+
+        async def create_batch(**kwargs):
+            return SimpleNamespace(id="batch", status="validating")
+
+        async def retrieve(batch_id):
+            return SimpleNamespace(
+                id=batch_id, status=next(statuses), output_file_id="file-out"
+            )
+
+        backend.client = SimpleNamespace(
+            files=SimpleNamespace(create=create_file, content=content),
+            batches=SimpleNamespace(create=create_batch, retrieve=retrieve),
+        )
+        retried = []
+
+        async def translate_batch(texts, source, target):
+            retried.extend(texts)
+            return [text.upper() for text in texts]
+
+        backend.translate_batch = translate_batch
+
+        result = asyncio.run(
+            backend.translate_bulk(["a", "b", "c"], "ja", "en", poll_interval=0)
+        )
+
+        assert result == ["A", "B", "C"]
+        assert retried == ["b"]
+        assert [r["custom_id"] for r in submitted["requests"]] == ["0", "1", "2"]
+
+
+class TestGoogleDetectAndTranslate:
+    """Test detection and translation in one Google request."""
+
+    @staticmethod
+    def run(source: str, detected: str) -> tuple[tuple[str | None, str], list[str]]:
+        """Detect and translate with a stub translator, recording the sources."""
+        backend = GoogleTranslateBackend()
+        requested = []
+
+        async def translate(text, src, dest):
+            requested.append(src)
+            return SimpleNamespace(src=detected, text=f"{text} from {src}")
+
+        backend.translator = SimpleNamespace(translate=translate)
+        result = asyncio.run(backend.detect_and_translate("text", source, "en"))
+        return result, requested
+
+    def test_matching_source_makes_one_request(self) -> None:
+        """Test that a detected source matching the given one is not redone."""
+        result, requested = self.run("ja", "ja")
+        assert result == ("ja", "text from auto")
+        assert requested == ["auto"]
+
+    def test_other_source_is_translated_again(self) -> None:
+        """Test that the given source is used when detection disagrees."""
+        result, requested = self.run("ja", "zh-CN")
+        assert result == ("zh-CN", "text from ja")
+        assert requested == ["auto", "ja"]